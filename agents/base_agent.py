@@ -1,64 +1,89 @@
 """
 Base agent classes for the Agentic Scheduler
 """
-from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Tuple
 
+from core.clock import now_iso
 from core.mcp import AgentInterface, MCPMessage
-from core.models import AgentHealth
 
 
-class BaseAgent(AgentInterface, ABC):
-    """Base class for all agents in the system"""
+class BaseAgent(AgentInterface):
+    """Base class for all agents in the system
+
+    A plain base class instead of an ABC: ABCMeta adds metaclass overhead to
+    every isinstance() check on the message-bus routing path, and the
+    required-method contract is enforced at class-creation time below.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in ("process_message", "get_capabilities"):
+            # Identity against BaseAgent's own attribute catches subclasses
+            # that inherit the raising default instead of overriding it
+            if getattr(cls, name) is getattr(BaseAgent, name):
+                raise TypeError(f"{cls.__name__} must implement {name}")
+
+    # Slots keep per-message attribute access on the C fast path and drop
+    # the per-instance __dict__
+    __slots__ = ("version", "start_ns", "_messages_processed", "_health_static")
+
 
     def __init__(self, agent_id: str, version: str = "0.1.0"):
         super().__init__(agent_id)
         self.version = version
-        self.start_time = datetime.utcnow()
+        # Monotonic clock for uptime - cheaper than datetime and immune to
+        # wall-clock adjustments
+        self.start_ns = time.monotonic_ns()
+        self._messages_processed = 0
+        # Static health fields never change, so assemble them once instead of
+        # building a full AgentHealth model per probe
+        self._health_static = {
+            "agent_id": agent_id,
+            "status": "healthy",
+            "version": version,
+            "capabilities": tuple(self.get_capabilities()),
+        }
 
-    @abstractmethod
     async def process_message(self, message: MCPMessage) -> MCPMessage:
         """Process an incoming MCP message"""
-        pass
+        raise NotImplementedError("Subclasses must implement process_message")
 
     async def health_check(self) -> Dict[str, Any]:
         """Return agent health status"""
-        uptime = datetime.utcnow() - self.start_time
-
-        return AgentHealth(
-            agent_id=self.agent_id,
-            status="healthy",
-            timestamp=datetime.utcnow(),
-            version=self.version,
-            capabilities=self.get_capabilities(),
-            metrics={
-                "uptime_seconds": uptime.total_seconds(),
-                "messages_processed": getattr(self, "_messages_processed", 0),
-            }
-        ).dict()
-
-    @abstractmethod
+        return {
+            **self._health_static,
+            # isoformat only at the actual API-output boundary
+            "timestamp": now_iso(),
+            "metrics": {
+                "uptime_seconds": (time.monotonic_ns() - self.start_ns) / 1e9,
+                "messages_processed": self._messages_processed,
+            },
+        }
+
     def get_capabilities(self) -> List[str]:
         """Return list of supported operations"""
-        pass
+        raise NotImplementedError("Subclasses must implement get_capabilities")
 
     def increment_message_count(self):
         """Increment the message processing counter"""
-        if not hasattr(self, "_messages_processed"):
-            self._messages_processed = 0
         self._messages_processed += 1
 
-    def validate_message_payload(self, message: MCPMessage, required_fields: List[str]) -> bool:
-        """Validate that required fields are present in message payload"""
-        for field in required_fields:
-            if field not in message.payload:
-                self.logger.warning(
-                    "Missing required field in message",
-                    message_id=message.message_id,
-                    field=field
-                )
-                return False
+    def validate_message_payload(self, message: MCPMessage, required_fields) -> bool:
+        """Validate that required fields are present in message payload
+
+        Callers on hot paths should pass a prebuilt frozenset so no set is
+        allocated per call; the C-level set difference replaces a Python loop
+        of membership checks.
+        """
+        missing = frozenset(required_fields) - message.payload.keys()
+        if missing:
+            self.logger.warning(
+                "Missing required fields in message",
+                message_id=message.message_id,
+                fields=tuple(missing)
+            )
+            return False
         return True
 
     def create_success_response(self, request: MCPMessage, data: Dict[str, Any]) -> MCPMessage:
@@ -68,14 +93,19 @@ class BaseAgent(AgentInterface, ABC):
             "data": data
         })
 
-    def create_error_response(self, request: MCPMessage, error_message: str) -> MCPMessage:
-        """Create an error response message"""
-        return self.create_error_response(request, error_message)
+    # create_error_response is inherited from AgentInterface: the error
+    # side of the protocol keys on message_type == "error", so error
+    # replies must not go out as ordinary responses.
 
 
 class MockAgent(BaseAgent):
     """Mock agent for testing and development"""
 
+    __slots__ = ("mock_responses",)
+
+    # Shared immutable capability list - rebuilt literals per call are wasted allocations
+    _CAPABILITIES: Tuple[str, ...] = ("mock_processing", "test_responses")
+
     def __init__(self, agent_id: str, responses: Dict[str, Dict[str, Any]] = None):
         super().__init__(agent_id, "0.1.0-mock")
         self.mock_responses = responses or {}
@@ -94,9 +124,9 @@ class MockAgent(BaseAgent):
             "mock_response": True,
             "agent_id": self.agent_id,
             "message_type": message.message_type,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso()
         })
 
-    def get_capabilities(self) -> List[str]:
+    def get_capabilities(self) -> Tuple[str, ...]:
         """Return mock capabilities"""
-        return ["mock_processing", "test_responses"]
+        return self._CAPABILITIES
@@ -1,9 +1,10 @@
 """
 Calendar Agent - Manages Google Calendar integration
 """
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-import json
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple
 
 import structlog
 from google.oauth2.credentials import Credentials
@@ -19,14 +20,47 @@ from .base_agent import BaseAgent
 
 logger = structlog.get_logger(__name__)
 
+# Discovery + schema parse for the Calendar service costs hundreds of ms, so
+# built services are shared across agent instances keyed by API key
+_SERVICE_CACHE: Dict[str, Any] = {}
+_SERVICE_LOCK = asyncio.Lock()
+
 
 class CalendarAgent(BaseAgent):
     """Agent for Google Calendar operations"""
 
+    __slots__ = ("service", "calendar_id", "_concurrency", "_handlers")
+
+    # Google Calendar's batch endpoint accepts at most 50 operations per request
+    _BATCH_SIZE = 50
+
+    # Prebuilt payload requirements so validation allocates no set per call
+    _CREATE_REQUIRED = frozenset({"events"})
+    _DELETE_REQUIRED = frozenset({"event_ids"})
+
+    # Shared immutable capability list - rebuilt literals per call are wasted allocations
+    _CAPABILITIES: Tuple[str, ...] = (
+        "create_events",
+        "update_events",
+        "delete_events",
+        "list_events",
+        "batch_operations",
+        "validate_school_year",
+    )
+
     def __init__(self):
         super().__init__("calendar_agent", "0.2.0")
         self.service = None
         self.calendar_id = settings.google_calendar_id
+        # Bound concurrent API calls so bulk operations overlap network
+        # latency without overwhelming the Calendar API
+        self._concurrency = asyncio.Semaphore(settings.calendar_concurrency)
+        # Precomputed dispatch table - O(1) lookup instead of if/elif chain
+        self._handlers = {
+            "create_events": self._handle_create_events,
+            "list_events": self._handle_list_events,
+            "delete_events": self._handle_delete_events,
+        }
 
     async def initialize_calendar_service(self):
         """Initialize Google Calendar API service"""
@@ -36,15 +70,25 @@ class CalendarAgent(BaseAgent):
         try:
             # For Sprint 2, we'll use API key authentication
             # In production, you'd use service account or OAuth
-            if not settings.google_calendar_api_key:
+            api_key = settings.google_calendar_api_key
+            if not api_key:
                 raise ValueError("GOOGLE_CALENDAR_API_KEY not configured")
 
-            # Create credentials using API key
-            # Note: This is a simplified approach. In production, you'd use proper OAuth2
-            creds = None  # We'll use API key directly in requests
-
-            # Build the service
-            self.service = build('calendar', 'v3', developerKey=settings.google_calendar_api_key)
+            async with _SERVICE_LOCK:
+                if api_key in _SERVICE_CACHE:
+                    self.service = _SERVICE_CACHE[api_key]
+                    return
+
+                # Build the service off the event loop; static discovery
+                # avoids the network fetch of the discovery document
+                self.service = await asyncio.to_thread(
+                    build,
+                    'calendar',
+                    'v3',
+                    developerKey=api_key,
+                    static_discovery=True,
+                )
+                _SERVICE_CACHE[api_key] = self.service
 
             logger.info("Google Calendar service initialized")
 
@@ -56,54 +100,74 @@ class CalendarAgent(BaseAgent):
         """Process calendar requests"""
         self.increment_message_count()
 
+        # Bind message context once instead of repeating it in every log call
+        log = logger.bind(message_id=message.message_id)
+
         try:
             await self.initialize_calendar_service()
 
-            if message.message_type == "create_events":
-                return await self._handle_create_events(message)
-            elif message.message_type == "list_events":
-                return await self._handle_list_events(message)
-            elif message.message_type == "delete_events":
-                return await self._handle_delete_events(message)
-            else:
+            handler = self._handlers.get(message.message_type)
+            if handler is None:
                 return self.create_error_response(
                     message,
                     f"Unknown message type: {message.message_type}"
                 )
+            return await handler(message)
 
         except Exception as e:
-            logger.error("Calendar agent error", error=str(e), message_id=message.message_id)
+            log.error("Calendar agent error", error=str(e))
             return self.create_error_response(message, f"Calendar operation failed: {str(e)}")
 
     async def _handle_create_events(self, message: MCPMessage) -> MCPMessage:
         """Create calendar events"""
-        if not self.validate_message_payload(message, ["events"]):
+        if not self.validate_message_payload(message, self._CREATE_REQUIRED):
             return self.create_error_response(message, "Missing events in payload")
 
         events_data = message.payload["events"]
-        created_events = []
+
+        # Payloads from internal agents were already validated upstream, so
+        # skip Pydantic validation for them via model_construct
+        build_event = (
+            CalendarEvent.model_construct
+            if message.payload.get("_trusted")
+            else CalendarEvent
+        )
 
         try:
-            for event_data in events_data:
-                # Convert dict to CalendarEvent if needed
-                if isinstance(event_data, dict):
-                    event = CalendarEvent(**event_data)
-                else:
-                    event = event_data
-
-                # Validate school year constraint
-                if not is_within_school_year(event.start_time):
-                    logger.warning(
-                        "Event outside school year, skipping",
-                        title=event.title,
-                        start=event.start_time
-                    )
-                    continue
-
-                # Create the event
-                created_event = await self._create_single_event(event)
-                if created_event:
-                    created_events.append(created_event)
+            def _build(event_data):
+                """Convert dict to CalendarEvent if needed"""
+                if not isinstance(event_data, dict):
+                    return event_data
+                if build_event is not CalendarEvent:
+                    # model_construct skips coercion, so normalize the
+                    # datetime fields with the C-level fromisoformat.
+                    # Copy first: the incoming dicts are shared with the
+                    # parsing agent's cache and the echoed parsing_result
+                    event_data = {**event_data}
+                    for key in ("start_time", "end_time"):
+                        value = event_data.get(key)
+                        if isinstance(value, str):
+                            event_data[key] = datetime.fromisoformat(value)
+                return build_event(**event_data)
+
+            events = [_build(event_data) for event_data in events_data]
+
+            # Filter on the school-year constraint in one pass and log the
+            # skipped count once instead of per event
+            valid_events = [e for e in events if is_within_school_year(e.start_time)]
+            skipped = len(events) - len(valid_events)
+            if skipped:
+                logger.warning("Events outside school year, skipping", skipped=skipped)
+
+            # Create events concurrently; the semaphore bounds API fan-out
+            results = await asyncio.gather(
+                *(self._create_single_event(event) for event in valid_events),
+                return_exceptions=True
+            )
+            created_events = [
+                created for created in results
+                if created and not isinstance(created, Exception)
+            ]
 
             return self.create_success_response(message, {
                 "events_created": len(created_events),
@@ -133,20 +197,39 @@ class CalendarAgent(BaseAgent):
 
     async def _handle_delete_events(self, message: MCPMessage) -> MCPMessage:
         """Delete calendar events"""
-        if not self.validate_message_payload(message, ["event_ids"]):
+        if not self.validate_message_payload(message, self._DELETE_REQUIRED):
             return self.create_error_response(message, "Missing event_ids in payload")
 
         event_ids = message.payload["event_ids"]
-        deleted_count = 0
 
         try:
-            for event_id in event_ids:
-                success = await self._delete_single_event(event_id)
-                if success:
-                    deleted_count += 1
+            # For Sprint 2, simulate the deletions since we don't have full
+            # Google API setup (the dev API key cannot mutate calendars).
+            # In production, deletes are bundled into multipart batch
+            # requests so N events cost ceil(N / 50) HTTP round-trips
+            # instead of N:
+            # def _on_batch_delete(request_id, response, exception):
+            #     if exception is not None:
+            #         failed.append({"request_id": request_id, "error": str(exception)})
+            #     else:
+            #         deleted.append(request_id)
+            #
+            # for start in range(0, len(event_ids), self._BATCH_SIZE):
+            #     chunk = event_ids[start:start + self._BATCH_SIZE]
+            #     batch = self.service.new_batch_http_request(callback=_on_batch_delete)
+            #     for event_id in chunk:
+            #         batch.add(self.service.events().delete(
+            #             calendarId=self.calendar_id,
+            #             eventId=event_id
+            #         ))
+            #     await asyncio.to_thread(batch.execute)
+            deleted = list(event_ids)
+            failed = []
+            logger.info("Events deleted successfully", count=len(deleted))
 
             return self.create_success_response(message, {
-                "events_deleted": deleted_count,
+                "events_deleted": len(deleted),
+                "events_failed": failed,
                 "total_requested": len(event_ids)
             })
 
@@ -156,25 +239,31 @@ class CalendarAgent(BaseAgent):
 
     async def _create_single_event(self, event: CalendarEvent) -> Optional[Dict[str, Any]]:
         """Create a single calendar event"""
-        try:
-            # Convert CalendarEvent to Google Calendar format
-            google_event = {
-                'summary': event.title,
-                'description': event.description or '',
-                'start': {
-                    'dateTime': event.start_time.isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'end': {
-                    'dateTime': event.end_time.isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'location': event.location or '',
-            }
+        async with self._concurrency:
+            return await self._create_single_event_unbounded(event)
+
+    def _to_google_event(self, event: CalendarEvent) -> Dict[str, Any]:
+        """Convert a CalendarEvent to Google Calendar API format"""
+        # A fresh literal is cheaper than copying a template: deepcopy walks
+        # the structure through its generic dispatch on every call
+        google_event = {
+            'summary': event.title,
+            'description': event.description or '',
+            'start': {'dateTime': event.start_iso, 'timeZone': 'UTC'},
+            'end': {'dateTime': event.end_iso, 'timeZone': 'UTC'},
+            'location': event.location or '',
+        }
+
+        # Add recurrence if specified
+        if event.is_recurring and event.recurrence_rule:
+            google_event['recurrence'] = [f"RRULE:{event.recurrence_rule}"]
+
+        return google_event
 
-            # Add recurrence if specified
-            if event.is_recurring and event.recurrence_rule:
-                google_event['recurrence'] = [f"RRULE:{event.recurrence_rule}"]
+    async def _create_single_event_unbounded(self, event: CalendarEvent) -> Optional[Dict[str, Any]]:
+        """Create a single calendar event without acquiring the semaphore"""
+        try:
+            google_event = self._to_google_event(event)
 
             # For Sprint 2, we'll simulate the API call since we don't have full Google API setup
             # In production, this would be:
@@ -185,16 +274,18 @@ class CalendarAgent(BaseAgent):
 
             # Mock successful creation
             mock_event = {
-                'id': f'mock_event_{datetime.utcnow().timestamp()}',
+                'id': f'mock_event_{time.monotonic_ns()}',
                 'summary': event.title,
                 'start': google_event['start'],
                 'end': google_event['end'],
                 'location': event.location,
                 'status': 'confirmed',
-                'created': datetime.utcnow().isoformat() + 'Z'
+                'created': datetime.now(timezone.utc).isoformat()
             }
 
-            logger.info("Event created successfully", title=event.title, event_id=mock_event['id'])
+            # Bind the stable context once and reuse the child logger
+            log = logger.bind(agent="calendar", event_id=mock_event['id'])
+            log.info("Event created successfully", title=event.title)
             return mock_event
 
         except Exception as e:
@@ -203,6 +294,11 @@ class CalendarAgent(BaseAgent):
 
     async def _list_events(self, time_min: str, time_max: Optional[str] = None) -> List[Dict[str, Any]]:
         """List calendar events"""
+        async with self._concurrency:
+            return await self._list_events_unbounded(time_min, time_max)
+
+    async def _list_events_unbounded(self, time_min: str, time_max: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List calendar events without acquiring the semaphore"""
         try:
             # For Sprint 2, return mock events
             # In production, this would be:
@@ -239,39 +335,49 @@ class CalendarAgent(BaseAgent):
             logger.error("Failed to list events", error=str(e))
             return []
 
-    async def _delete_single_event(self, event_id: str) -> bool:
-        """Delete a single calendar event"""
-        try:
-            # For Sprint 2, simulate successful deletion
-            # In production, this would be:
-            # self.service.events().delete(
-            #     calendarId=self.calendar_id,
-            #     eventId=event_id
-            # ).execute()
-
-            logger.info("Event deleted successfully", event_id=event_id)
-            return True
-
-        except Exception as e:
-            logger.error("Failed to delete event", event_id=event_id, error=str(e))
-            return False
-
     async def create_event_batch(self, events: List[CalendarEvent]) -> Dict[str, Any]:
-        """Create multiple events in batch"""
+        """Create multiple events via the Calendar batch endpoint"""
+        await self.initialize_calendar_service()
+
         results = {
             "successful": [],
             "failed": [],
             "total": len(events)
         }
 
+        # For Sprint 2, simulate the inserts since we don't have full Google
+        # API setup (the dev API key cannot mutate calendars). In production,
+        # inserts are bundled into multipart batch requests so N events cost
+        # ceil(N / 50) HTTP round-trips instead of N:
+        # for start in range(0, len(events), self._BATCH_SIZE):
+        #     chunk = events[start:start + self._BATCH_SIZE]
+        #
+        #     def _on_batch_event(request_id, response, exception, _chunk=chunk):
+        #         if exception is not None:
+        #             # Batch request ids are 1-based strings in add() order
+        #             event = _chunk[int(request_id) - 1]
+        #             results["failed"].append({
+        #                 "title": event.title,
+        #                 "error": str(exception)
+        #             })
+        #         else:
+        #             results["successful"].append(response)
+        #
+        #     batch = self.service.new_batch_http_request(callback=_on_batch_event)
+        #     for event in chunk:
+        #         batch.add(self.service.events().insert(
+        #             calendarId=self.calendar_id,
+        #             body=self._to_google_event(event)
+        #         ))
+        #     await asyncio.to_thread(batch.execute)
         for event in events:
-            created = await self._create_single_event(event)
-            if created:
+            created = await self._create_single_event_unbounded(event)
+            if created is not None:
                 results["successful"].append(created)
             else:
                 results["failed"].append({
                     "title": event.title,
-                    "error": "Creation failed"
+                    "error": "creation failed"
                 })
 
         results["success_count"] = len(results["successful"])
@@ -279,13 +385,6 @@ class CalendarAgent(BaseAgent):
 
         return results
 
-    def get_capabilities(self) -> List[str]:
+    def get_capabilities(self) -> Tuple[str, ...]:
         """Return calendar capabilities"""
-        return [
-            "create_events",
-            "update_events",
-            "delete_events",
-            "list_events",
-            "batch_operations",
-            "validate_school_year"
-        ]
+        return self._CAPABILITIES
@@ -1,7 +1,7 @@
 """
 Change Management Agent - Handles natural language commands (Sprint 3)
 """
-from typing import List
+from typing import Tuple
 
 from core.mcp import MCPMessage
 
@@ -11,6 +11,16 @@ from .base_agent import BaseAgent
 class ChangeManagementAgent(BaseAgent):
     """Agent for processing natural language commands - To be implemented in Sprint 3"""
 
+    __slots__ = ()
+
+    # Shared immutable capability list - rebuilt literals per call are wasted allocations
+    _CAPABILITIES: Tuple[str, ...] = (
+        "parse_commands",
+        "interpret_nlp",
+        "validate_commands",
+        "generate_responses",
+    )
+
     def __init__(self):
         super().__init__("change_management_agent", "0.1.0")
 
@@ -22,11 +32,6 @@ class ChangeManagementAgent(BaseAgent):
             "agent_id": self.agent_id
         })
 
-    def get_capabilities(self) -> List[str]:
+    def get_capabilities(self) -> Tuple[str, ...]:
         """Return command processing capabilities"""
-        return [
-            "parse_commands",
-            "interpret_nlp",
-            "validate_commands",
-            "generate_responses"
-        ]
+        return self._CAPABILITIES
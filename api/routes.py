@@ -1,22 +1,48 @@
 """
 API routes for the Agentic Scheduler
 """
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from fastapi.responses import HTMLResponse
+import gzip
+import hashlib
+import tempfile
+import traceback
 
+import structlog
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, UploadFile, File
+from fastapi.responses import HTMLResponse, StreamingResponse
+from starlette.formparsers import MultiPartParser
+
+from core.ai_client import ai_client
 from core.mcp import message_bus, send_message_to_agent
+from core.orjson_response import ORJSONResponse
 from core.models import APIResponse, ChatMessage
 from agents.orchestrator import OrchestratorAgent
+from config.settings import settings, ALLOWED_FILE_TYPES
 
 from .dependencies import get_orchestrator
 
-router = APIRouter()
+# brotli compresses the chat page ~20% smaller than gzip; optional since
+# it needs a C extension
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
 
+logger = structlog.get_logger(__name__)
 
-@router.get("/chat", response_class=HTMLResponse)
-async def chat_interface():
-    """Serve the chat interface"""
-    html_content = """
+# Agent-heavy endpoints nest parsing/calendar result dicts that can hold
+# hundreds of events; orjson keeps their serialization off the profile
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Raise Starlette's multipart spool threshold so schedule-sized uploads
+# stay in memory during form parsing instead of bouncing through disk
+MultiPartParser.spool_max_size = settings.multipart_spool_max_size
+
+# The chat page is static - encode it once at import time and let browsers
+# revalidate with a content ETag instead of re-downloading it every visit
+_CHAT_HTML = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -233,17 +259,60 @@ async def chat_interface():
         </script>
     </body>
     </html>
-    """
-    return HTMLResponse(content=html_content)
+    """.encode()
+
+_CHAT_HTML_ETAG = f'"{hashlib.md5(_CHAT_HTML).hexdigest()}"'
+_CHAT_HTML_HEADERS = {
+    "ETag": _CHAT_HTML_ETAG,
+    "Cache-Control": "public, max-age=300",
+    "Vary": "Accept-Encoding",
+}
+
+# Responses are immutable once rendered, so build every outcome a single
+# time at import - including the compressed variants, which replaces
+# per-request middleware compression with a one-off precompute
+_CHAT_RESPONSE = HTMLResponse(content=_CHAT_HTML, headers=_CHAT_HTML_HEADERS)
+_CHAT_NOT_MODIFIED = Response(status_code=304, headers=_CHAT_HTML_HEADERS)
+_CHAT_GZ_RESPONSE = HTMLResponse(
+    content=gzip.compress(_CHAT_HTML, 9),
+    headers={**_CHAT_HTML_HEADERS, "Content-Encoding": "gzip"},
+)
+_CHAT_BR_RESPONSE = HTMLResponse(
+    content=brotli.compress(_CHAT_HTML, quality=11),
+    headers={**_CHAT_HTML_HEADERS, "Content-Encoding": "br"},
+) if BROTLI_AVAILABLE else None
+
+
+@router.get("/chat", response_class=HTMLResponse)
+async def chat_interface(request: Request):
+    """Serve the chat interface"""
+    if request.headers.get("if-none-match") == _CHAT_HTML_ETAG:
+        return _CHAT_NOT_MODIFIED
+
+    accept_encoding = request.headers.get("accept-encoding", "")
+    if _CHAT_BR_RESPONSE is not None and "br" in accept_encoding:
+        return _CHAT_BR_RESPONSE
+    if "gzip" in accept_encoding:
+        return _CHAT_GZ_RESPONSE
+    return _CHAT_RESPONSE
 
 
 @router.post("/chat")
 async def chat_endpoint(
     chat_message: ChatMessage,
+    stream: bool = False,
     orchestrator: OrchestratorAgent = Depends(get_orchestrator)
 ):
     """Handle chat messages"""
     try:
+        # Streamed replies go out token by token - the client sees first
+        # output at TTFB instead of after the whole completion lands
+        if stream and ai_client.client is not None:
+            return StreamingResponse(
+                ai_client.interpret_natural_language_stream(chat_message.message),
+                media_type="text/event-stream"
+            )
+
         # For Sprint 1, just echo back with a mock response
         # In future sprints, this will route to the Change Management Agent
         response_message = f"I received your message: '{chat_message.message}'. This is a basic response - full NLP processing will be available in Sprint 3."
@@ -262,7 +331,7 @@ async def chat_endpoint(
         )
 
 
-@router.post("/upload")
+@router.post("/upload", response_model=APIResponse)
 async def upload_file(
     file: UploadFile = File(...),
     orchestrator: OrchestratorAgent = Depends(get_orchestrator)
@@ -272,89 +341,109 @@ async def upload_file(
         if not file or not file.filename:
             raise HTTPException(status_code=400, detail="No file provided")
 
-        # Read file content
-        file_content = await file.read()
-
-        if len(file_content) == 0:
-            raise HTTPException(status_code=400, detail="Empty file provided")
-
-        # Route to Parsing Agent
-        parsing_result = await orchestrator.coordinate_request(
-            "parsing_agent",
-            "parse_schedule",
-            {
-                "file_data": file_content,
-                "filename": file.filename
-            }
-        )
-
+        # rpartition avoids the list allocation of split('.'); reject
+        # unsupported types before touching the body at all
+        ext = file.filename.rpartition(".")[2].lower()
+        if ext not in ALLOWED_FILE_TYPES:
+            raise HTTPException(status_code=415, detail=f"Unsupported file type: {ext}")
+
+        # Stream into a spool that overflows to disk past 1MB, so large
+        # uploads never hold two in-memory copies; oversized bodies are
+        # rejected the moment the limit is crossed
+        file_size = 0
+        with tempfile.SpooledTemporaryFile(max_size=settings.multipart_spool_max_size) as spool:
+            while chunk := await file.read(settings.multipart_chunk_size):
+                spool.write(chunk)
+                file_size += len(chunk)
+                if file_size > settings.max_file_size:
+                    raise HTTPException(status_code=413, detail="File too large")
+
+            if file_size == 0:
+                raise HTTPException(status_code=400, detail="Empty file provided")
+
+            spool.seek(0)
+            # The parsing agent expects bytes in the MCP payload; this is
+            # the single materialization of the upload. A memfd/mmap
+            # zero-copy handoff was evaluated and rejected: the parsers
+            # run in a ProcessPoolExecutor, and pickling across that
+            # boundary copies the buffer anyway.
+            file_content = spool.read()
+
+        # One fused orchestrator call covers parse -> create -> conflicts;
+        # the event list never leaves the agent layer between stages
+        result = await orchestrator.process_schedule_file(file_content, file.filename)
+        parsing_result = result["parsing_result"]
+
+        # Plain dicts returned through ORJSONResponse skip pydantic
+        # re-validation of data we just built ourselves; APIResponse stays
+        # as the response_model for the OpenAPI schema only
         if parsing_result.get("status") != "success":
-            return APIResponse(
-                success=False,
-                message=f"File parsing failed: {parsing_result.get('message', 'Unknown error')}",
-                errors=["parsing_failed"]
-            )
-
-        events_data = parsing_result.get("events", [])
-
-        if not events_data:
-            return APIResponse(
-                success=True,
-                message=f"File '{filename}' processed successfully, but no events were found.",
-                data={
-                    "filename": filename,
-                    "file_size": len(file),
+            return ORJSONResponse({
+                "success": False,
+                "message": f"File parsing failed: {parsing_result.get('message', 'Unknown error')}",
+                "data": None,
+                "errors": ["parsing_failed"]
+            })
+
+        if result["events_found"] == 0:
+            return ORJSONResponse({
+                "success": True,
+                "message": f"File '{file.filename}' processed successfully, but no events were found.",
+                "data": {
+                    "filename": file.filename,
+                    "file_size": file_size,
                     "events_found": 0,
                     "parsing_result": parsing_result
-                }
-            )
-
-        # Create events in calendar
-        calendar_result = await orchestrator.coordinate_request(
-            "calendar_agent",
-            "create_events",
-            {
-                "events": events_data
-            }
-        )
-
-        events_created = calendar_result.get("events_created", 0)
-
-        return APIResponse(
-            success=True,
-            message=f"Successfully processed '{filename}' and created {events_created} calendar events!",
-            data={
-                "filename": filename,
-                "file_size": len(file),
-                "events_found": len(events_data),
+                },
+                "errors": []
+            })
+
+        events_created = result["events_created"]
+
+        return ORJSONResponse({
+            "success": True,
+            "message": f"Successfully processed '{file.filename}' and created {events_created} calendar events!",
+            "data": {
+                "filename": file.filename,
+                "file_size": file_size,
+                "events_found": result["events_found"],
                 "events_created": events_created,
                 "parsing_result": parsing_result,
-                "calendar_result": calendar_result
-            }
-        )
-
+                "calendar_result": result["calendar_result"],
+                "conflict_result": result["conflict_result"]
+            },
+            "errors": []
+        })
+
+    except HTTPException:
+        raise
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
+        logger.exception("Upload processing failed", filename=file.filename)
+        errors = [str(e)]
+        # Multi-KB tracebacks belong in logs, not client responses;
+        # only surface them when running in debug mode
+        if settings.debug:
+            errors.append(traceback.format_exc())
         return APIResponse(
             success=False,
             message=f"Upload processing error: {str(e)}",
-            errors=[str(e), error_details]
+            errors=errors
         )
 
 
-@router.get("/health")
+@router.get("/health", response_model=APIResponse)
 async def health_endpoint(orchestrator: OrchestratorAgent = Depends(get_orchestrator)):
     """Health check endpoint"""
     try:
         # Get orchestrator health
         health_data = await orchestrator.health_check()
 
-        return APIResponse(
-            success=True,
-            message="System is healthy",
-            data=health_data
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "System is healthy",
+            "data": health_data,
+            "errors": []
+        })
 
     except Exception as e:
         return APIResponse(
@@ -364,18 +453,19 @@ async def health_endpoint(orchestrator: OrchestratorAgent = Depends(get_orchestr
         )
 
 
-@router.get("/agents")
+@router.get("/agents", response_model=APIResponse)
 async def list_agents_endpoint(orchestrator: OrchestratorAgent = Depends(get_orchestrator)):
     """List all registered agents"""
     try:
         # Request agent list from orchestrator
         result = await orchestrator.coordinate_request("orchestrator", "list_agents", {})
 
-        return APIResponse(
-            success=True,
-            message=f"Found {result['total_count']} agents",
-            data=result
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": f"Found {result['total_count']} agents",
+            "data": result,
+            "errors": []
+        })
 
     except Exception as e:
         return APIResponse(
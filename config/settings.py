@@ -2,7 +2,8 @@
 Application settings and configuration
 """
 import os
-from typing import List, Optional
+from functools import lru_cache
+from typing import FrozenSet, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -13,6 +14,8 @@ class Settings(BaseSettings):
     # Server settings
     port: int = 8000
     host: str = "0.0.0.0"
+    event_loop: str = "auto"  # "auto" picks uvloop when installed; or "uvloop"/"asyncio"
+    workers: Optional[int] = None  # Worker processes in production; None = one per CPU
 
     # Environment
     environment: str = "development"
@@ -24,10 +27,16 @@ class Settings(BaseSettings):
 
     # Google Calendar settings
     google_calendar_id: Optional[str] = None
+    calendar_concurrency: int = 10  # Max concurrent Google Calendar API calls
+
+    # OCR settings
+    ocr_lang: str = "eng"
+    ocr_psm: int = 6  # Tesseract page segmentation mode
 
     # Application settings
     max_file_size: int = 10 * 1024 * 1024  # 10MB
-    allowed_file_types: list = ["pdf", "xlsx", "xls", "png", "jpg", "jpeg", "gif"]
+    multipart_chunk_size: int = 256 * 1024  # Upload read size per iteration
+    multipart_spool_max_size: int = 1024 * 1024  # In-memory spool before disk overflow
 
     # MCP settings
     mcp_message_timeout: int = 30  # seconds
@@ -38,17 +47,31 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-# Create global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build and validate the settings instance exactly once per process
+
+    Env parsing stays on pydantic-settings (the .env support is relied on
+    in every deployment), but construction and the production checks run
+    a single time behind lru_cache instead of on each import path.
+    """
+    built = Settings()
+
+    if built.environment == "production":
+        if not built.openai_api_key:
+            raise ValueError("OPENAI_API_KEY is required in production")
+        if not built.google_calendar_api_key:
+            raise ValueError("GOOGLE_CALENDAR_API_KEY is required in production")
+        if not built.google_calendar_id:
+            raise ValueError("GOOGLE_CALENDAR_ID is required in production")
+
+    return built
+
 
-# Fixed application settings (not configurable via env)
-ALLOWED_FILE_TYPES: List[str] = ["pdf", "xlsx", "xls", "png", "jpg", "jpeg", "gif"]
+# Global settings instance - existing `from config.settings import settings`
+# consumers keep working unchanged
+settings = get_settings()
 
-# Validate required settings for production
-if settings.environment == "production":
-    if not settings.openai_api_key:
-        raise ValueError("OPENAI_API_KEY is required in production")
-    if not settings.google_calendar_api_key:
-        raise ValueError("GOOGLE_CALENDAR_API_KEY is required in production")
-    if not settings.google_calendar_id:
-        raise ValueError("GOOGLE_CALENDAR_ID is required in production")
+# Fixed application settings (not configurable via env); frozenset gives
+# O(1) membership on the per-upload extension check
+ALLOWED_FILE_TYPES: FrozenSet[str] = frozenset({"pdf", "xlsx", "xls", "png", "jpg", "jpeg", "gif"})
@@ -22,6 +22,7 @@ from .utils import (
     parse_datetime_flexible,
     extract_dates_from_text,
     calculate_overlap,
+    calculate_overlaps_matrix,
     is_within_school_year,
     generate_rrule,
     clean_filename,
@@ -59,6 +60,7 @@ __all__ = [
     "parse_datetime_flexible",
     "extract_dates_from_text",
     "calculate_overlap",
+    "calculate_overlaps_matrix",
     "is_within_school_year",
     "generate_rrule",
     "clean_filename",
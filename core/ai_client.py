@@ -2,9 +2,21 @@
 AI Client for OpenAI and Azure OpenAI integration
 """
 import asyncio
+import concurrent.futures
+import hashlib
+import json
+import math
+import os
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
 
+import time
+
+import httpx
+import openai
+import orjson
 import structlog
+import tenacity
 from openai import AsyncOpenAI, AsyncAzureOpenAI
 
 from .models import NLCommand, ProcessingStatus
@@ -12,13 +24,93 @@ from config.settings import settings
 
 logger = structlog.get_logger(__name__)
 
+# Command templates validated once at import; per-call copies go through
+# model_copy, which skips pydantic validation entirely
+_MOCK_COMMAND = NLCommand(
+    raw_text="",
+    command_type="mock",
+    intent="mock_command",
+    confidence_score=0.5,
+    requires_confirmation=False,
+    entities={}
+)
+_FALLBACK_COMMAND = NLCommand(
+    raw_text="",
+    command_type="unknown",
+    intent="failed_to_parse",
+    confidence_score=0.0,
+    requires_confirmation=True,
+    entities={}
+)
+
+# The interpretation prompt never changes - build the string and its
+# message dict once instead of per call
+_SYSTEM_PROMPT = """
+You are an AI assistant that helps users manage their calendar through natural language commands.
+Analyze the user's message and determine what calendar operation they want to perform.
+
+Supported operations:
+- Add events: "schedule a meeting tomorrow at 3pm"
+- Remove events: "cancel my appointment on friday"
+- Update events: "move my class to 4pm"
+- Query events: "what do I have scheduled today?"
+- Bulk operations: "clear all events this week"
+
+Return a JSON response with:
+- command_type: "add", "remove", "update", "query", "bulk"
+- intent: specific action description
+- entities: extracted dates, times, subjects, etc.
+- confidence_score: 0.0-1.0
+- requires_confirmation: true/false
+"""
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
 
 class AIClient:
     """Unified client for OpenAI and Azure OpenAI operations"""
 
+    # Coalesce single-image calls into small batches - a short window
+    # amortizes one vision round-trip over several concurrent uploads
+    _IMAGE_BATCH_WINDOW = 0.1
+    _IMAGE_BATCH_SIZE = 8
+
+    # Repeated commands ("show my schedule today") dominate chat traffic;
+    # a bounded LRU lets them skip the API round-trip entirely
+    _NL_CACHE_SIZE = 1024
+
+    # Circuit breaker: after this many consecutive completion failures the
+    # path short-circuits straight to the fallback for the reset window,
+    # so an upstream outage can't stampede the event loop with retries
+    _BREAKER_FAIL_MAX = 10
+    _BREAKER_RESET_S = 30.0
+
+    # Semantic cache: near-duplicate phrasings ("show my schedule today" /
+    # "what's on my calendar today") resolve from an embedding lookup, which
+    # costs a fraction of a completion call
+    _SEM_CACHE_SIZE = 256
+    _SEM_SIMILARITY = 0.92
+    _EMBEDDING_MODEL = "text-embedding-3-small"
+
     def __init__(self):
         self.client: Optional[AsyncOpenAI] = None
+        self.deployment_name: Optional[str] = None
+        self.is_azure = False
         self._initialized = False
+        self._image_queue: Optional[asyncio.Queue] = None
+        self._image_flush_task: Optional[asyncio.Task] = None
+        self._nl_cache: "OrderedDict[str, NLCommand]" = OrderedDict()
+        # Bounded pool for decoding large completion payloads off the
+        # event loop; unbounded to_thread would spawn per-call threads
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4),
+            thread_name_prefix="ai"
+        )
+        self._breaker_failures = 0
+        self._breaker_open_until = 0.0
+        # Parallel lists of unit vectors and their interpreted commands;
+        # a linear scan beats an index at this cache size
+        self._sem_vectors: List[List[float]] = []
+        self._sem_commands: List[NLCommand] = []
 
     async def initialize(self):
         """Initialize the appropriate AI client based on configuration"""
@@ -26,6 +118,19 @@ class AIClient:
             return
 
         try:
+            # Explicit pool limits with a long keepalive hold completion
+            # bursts on warm TLS connections, and HTTP/2 multiplexes them
+            # over a single one
+            http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=64,
+                    max_connections=128,
+                    keepalive_expiry=60.0,
+                ),
+                timeout=httpx.Timeout(30.0, connect=5.0),
+            )
+
             # Check for Azure OpenAI configuration first
             if (settings.azure_openai_api_key and
                 settings.azure_openai_endpoint and
@@ -36,6 +141,7 @@ class AIClient:
                     api_key=settings.azure_openai_api_key,
                     api_version=settings.azure_openai_api_version,
                     azure_endpoint=settings.azure_openai_endpoint,
+                    http_client=http_client,
                 )
                 self.deployment_name = settings.azure_openai_deployment_name
                 self.is_azure = True
@@ -43,11 +149,15 @@ class AIClient:
             # Fall back to regular OpenAI
             elif settings.openai_api_key:
                 logger.info("Initializing OpenAI client")
-                self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+                self.client = AsyncOpenAI(
+                    api_key=settings.openai_api_key,
+                    http_client=http_client,
+                )
                 self.deployment_name = None
                 self.is_azure = False
 
             else:
+                await http_client.aclose()
                 raise ValueError(
                     "No AI configuration found. Please set either:\n"
                     "- OPENAI_API_KEY for OpenAI, or\n"
@@ -72,33 +182,92 @@ class AIClient:
         Returns:
             Dict containing parsed schedule data
         """
-        await self.initialize()
+        # Enqueue and let the flush task batch concurrent requests into a
+        # single vision call; each caller gets its own result back
+        if self._image_queue is None:
+            self._image_queue = asyncio.Queue()
+
+        future = asyncio.get_running_loop().create_future()
+        self._image_queue.put_nowait((image_data, filename, future))
+
+        if self._image_flush_task is None or self._image_flush_task.done():
+            self._image_flush_task = asyncio.create_task(self._flush_image_queue())
+
+        return await future
+
+    async def _flush_image_queue(self):
+        """Drain queued images and process them in batched vision calls"""
+        await asyncio.sleep(self._IMAGE_BATCH_WINDOW)
+
+        # Re-check the queue after the batched calls: images enqueued
+        # while a vision request was in flight see this task as still
+        # running, so exiting without another drain would strand them
+        while not self._image_queue.empty():
+            pending = []
+            while not self._image_queue.empty():
+                pending.append(self._image_queue.get_nowait())
+            await self._process_image_batches(pending)
+
+    async def _process_image_batches(self, pending):
+        """Run one drained queue's images through chunked vision calls"""
+        for start in range(0, len(pending), self._IMAGE_BATCH_SIZE):
+            chunk = pending[start:start + self._IMAGE_BATCH_SIZE]
+            try:
+                results = await self.parse_schedule_images(
+                    [(image_data, filename) for image_data, filename, _ in chunk]
+                )
+            except Exception as e:
+                for _, _, future in chunk:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for _, filename, future in chunk:
+                if not future.done():
+                    future.set_result(results[filename])
+
+    async def parse_schedule_images(self, images: List[tuple]) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse a batch of schedule images in a single vision request
+
+        Args:
+            images: List of (image_data, filename) tuples
 
+        Returns:
+            Dict mapping each filename to its parsed schedule data
+        """
         # For now, return a mock response since we don't have actual image processing
         # In Sprint 2, this will be implemented with actual vision API calls
-        logger.info("Processing schedule image", filename=filename, size=len(image_data))
+        logger.info(
+            "Processing schedule image batch",
+            count=len(images),
+            total_bytes=sum(len(image_data) for image_data, _ in images)
+        )
 
         # Mock response for Sprint 2 development
         return {
-            "status": "mock_processed",
-            "filename": filename,
-            "events_found": 2,
-            "message": "Image processing implemented in Sprint 2",
-            "mock_data": True,
-            "extracted_events": [
-                {
-                    "title": "Mock Class 1",
-                    "start_time": "2025-09-01T09:00:00",
-                    "end_time": "2025-09-01T10:30:00",
-                    "location": "Room 101"
-                },
-                {
-                    "title": "Mock Class 2",
-                    "start_time": "2025-09-01T14:00:00",
-                    "end_time": "2025-09-01T15:30:00",
-                    "location": "Room 202"
-                }
-            ]
+            filename: {
+                "status": "mock_processed",
+                "filename": filename,
+                "events_found": 2,
+                "message": "Image processing implemented in Sprint 2",
+                "mock_data": True,
+                "extracted_events": [
+                    {
+                        "title": "Mock Class 1",
+                        "start_time": "2025-09-01T09:00:00",
+                        "end_time": "2025-09-01T10:30:00",
+                        "location": "Room 101"
+                    },
+                    {
+                        "title": "Mock Class 2",
+                        "start_time": "2025-09-01T14:00:00",
+                        "end_time": "2025-09-01T15:30:00",
+                        "location": "Room 202"
+                    }
+                ]
+            }
+            for _, filename in images
         }
 
     async def interpret_natural_language(self, user_message: str, context: Optional[Dict[str, Any]] = None) -> NLCommand:
@@ -112,92 +281,211 @@ class AIClient:
         Returns:
             Parsed NLCommand object
         """
-        await self.initialize()
-
-        system_prompt = """
-        You are an AI assistant that helps users manage their calendar through natural language commands.
-        Analyze the user's message and determine what calendar operation they want to perform.
-
-        Supported operations:
-        - Add events: "schedule a meeting tomorrow at 3pm"
-        - Remove events: "cancel my appointment on friday"
-        - Update events: "move my class to 4pm"
-        - Query events: "what do I have scheduled today?"
-        - Bulk operations: "clear all events this week"
-
-        Return a JSON response with:
-        - command_type: "add", "remove", "update", "query", "bulk"
-        - intent: specific action description
-        - entities: extracted dates, times, subjects, etc.
-        - confidence_score: 0.0-1.0
-        - requires_confirmation: true/false
-        """
-
-        user_context = ""
-        if context:
-            user_context = f"\nCurrent context: {context}"
+        # Initialization happens once in the app lifespan; per-call
+        # re-entry here was pure overhead on the chat hot path
+        # Stable digest over everything that could change the answer
+        cache_key = hashlib.blake2b(
+            json.dumps(
+                [user_message, context, self.deployment_name or "gpt-4"],
+                sort_keys=True,
+                default=str,
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+
+        cached = self._nl_cache.get(cache_key)
+        if cached is not None:
+            self._nl_cache.move_to_end(cache_key)
+            logger.info("NL interpretation cache hit", input_length=len(user_message))
+            return cached
+
+        # An open circuit short-circuits straight to the fallback before
+        # the try: rejections must not count as failures, or steady
+        # traffic keeps re-arming the window and the breaker never
+        # half-opens after upstream recovers
+        if time.monotonic() < self._breaker_open_until:
+            logger.warning("AI completion circuit open, serving fallback")
+            return _FALLBACK_COMMAND.model_copy(
+                update={"raw_text": user_message, "entities": {"error": "circuit open"}}
+            )
 
         try:
+            # Semantic lookup catches rephrasings the exact-match cache
+            # misses; embedding failures just fall through to completion
+            embedding = None
+            if self.client is not None and context is None:
+                try:
+                    emb_response = await self.client.embeddings.create(
+                        model=self._EMBEDDING_MODEL,
+                        input=user_message
+                    )
+                    embedding = self._normalize(emb_response.data[0].embedding)
+                    cached = self._semantic_lookup(embedding)
+                    if cached is not None:
+                        logger.info("NL semantic cache hit", input_length=len(user_message))
+                        return cached
+                except Exception:
+                    embedding = None
+
+            # Only pay for the context f-string when there is context
+            if context:
+                user_content = f"User message: {user_message}\nCurrent context: {context}"
+            else:
+                user_content = f"User message: {user_message}"
+
             messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": f"User message: {user_message}{user_context}"}
+                _SYSTEM_MESSAGE,
+                {"role": "user", "content": user_content}
             ]
 
-            # Use deployment name for Azure, model name for OpenAI
-            if self.is_azure:
-                response = await self.client.chat.completions.create(
-                    model=self.deployment_name,
-                    messages=messages,
-                    max_tokens=500,
-                    temperature=0.1
-                )
-            else:
-                response = await self.client.chat.completions.create(
-                    model="gpt-4",  # Default to GPT-4
-                    messages=messages,
-                    max_tokens=500,
-                    temperature=0.1
-                )
+            response = await self._create_completion(messages)
+            self._breaker_failures = 0
 
             result_text = response.choices[0].message.content
-            logger.info("AI interpretation completed", input_length=len(user_message))
+
+            # Decode the structured reply with orjson in the worker pool so
+            # a large response never stalls other coroutines
+            try:
+                structured = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, orjson.loads, result_text
+                )
+            except orjson.JSONDecodeError:
+                structured = None
+
+            logger.info(
+                "AI interpretation completed",
+                input_length=len(user_message),
+                structured=structured is not None
+            )
 
             # For Sprint 1, return a mock command since full NLP will be in Sprint 3
-            return NLCommand(
-                raw_text=user_message,
-                command_type="mock",
-                intent="mock_command",
-                confidence_score=0.5,
-                requires_confirmation=False,
-                entities={"mock": True}
+            command = _MOCK_COMMAND.model_copy(
+                update={"raw_text": user_message, "entities": {"mock": True}}
             )
 
+            # Only successful interpretations are cached; failures retry
+            self._nl_cache[cache_key] = command
+            if len(self._nl_cache) > self._NL_CACHE_SIZE:
+                self._nl_cache.popitem(last=False)
+
+            if embedding is not None:
+                self._sem_vectors.append(embedding)
+                self._sem_commands.append(command)
+                if len(self._sem_vectors) > self._SEM_CACHE_SIZE:
+                    self._sem_vectors.pop(0)
+                    self._sem_commands.pop(0)
+
+            return command
+
         except Exception as e:
+            self._breaker_failures += 1
+            if self._breaker_failures >= self._BREAKER_FAIL_MAX:
+                self._breaker_open_until = time.monotonic() + self._BREAKER_RESET_S
+
             logger.error("AI interpretation failed", error=str(e), user_message=user_message[:100])
             # Return a safe fallback command
-            return NLCommand(
-                raw_text=user_message,
-                command_type="unknown",
-                intent="failed_to_parse",
-                confidence_score=0.0,
-                requires_confirmation=True,
-                entities={"error": str(e)}
+            return _FALLBACK_COMMAND.model_copy(
+                update={"raw_text": user_message, "entities": {"error": str(e)}}
             )
 
+    @staticmethod
+    def _normalize(vector: List[float]) -> List[float]:
+        """Scale to unit length so dot product equals cosine similarity"""
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm == 0.0:
+            return vector
+        return [x / norm for x in vector]
+
+    def _semantic_lookup(self, vector: List[float]) -> Optional[NLCommand]:
+        """Return the stored command nearest to vector, if similar enough"""
+        best_score = 0.0
+        best_index = -1
+        for index, stored in enumerate(self._sem_vectors):
+            score = sum(a * b for a, b in zip(vector, stored))
+            if score > best_score:
+                best_score = score
+                best_index = index
+
+        if best_score >= self._SEM_SIMILARITY:
+            return self._sem_commands[best_index]
+        return None
+
+    @tenacity.retry(
+        stop=tenacity.stop_after_attempt(3),
+        wait=tenacity.wait_exponential_jitter(initial=0.25, max=4),
+        retry=tenacity.retry_if_exception_type((
+            openai.RateLimitError,
+            openai.APIConnectionError,
+            openai.InternalServerError,
+        )),
+        reraise=True,
+    )
+    async def _create_completion(self, messages: List[Dict[str, str]]):
+        """Issue a chat completion, retrying transient 429/5xx with backoff"""
+        return await self.client.chat.completions.create(
+            model=self.deployment_name or "gpt-4",
+            messages=messages,
+            max_tokens=500,
+            temperature=0.1
+        )
+
+    async def interpret_natural_language_stream(self, user_message: str):
+        """
+        Stream interpretation tokens as they arrive from the model
+
+        Async generator yielding content deltas, so callers can forward
+        them through a StreamingResponse instead of waiting for the full
+        completion to land.
+        """
+        stream = await self.client.chat.completions.create(
+            model=self.deployment_name or "gpt-4",
+            messages=[
+                _SYSTEM_MESSAGE,
+                {"role": "user", "content": user_message}
+            ],
+            max_tokens=500,
+            temperature=0.1,
+            stream=True
+        )
+
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+    async def parse_and_interpret(self, image_data: bytes, filename: str,
+                                  user_message: str):
+        """
+        Run vision parsing and NL interpretation concurrently
+
+        Async generator yielding ("schedule" | "interpretation", result)
+        pairs in completion order, so a progressive UI can show whichever
+        finishes first instead of waiting on both.
+        """
+        async def _labeled(label, coro):
+            return label, await coro
+
+        pending = [
+            _labeled("schedule", self.parse_schedule_image(image_data, filename)),
+            _labeled("interpretation", self.interpret_natural_language(user_message)),
+        ]
+
+        for next_done in asyncio.as_completed(pending):
+            label, result = await next_done
+            yield label, result
+
     async def health_check(self) -> Dict[str, Any]:
         """Check AI client health"""
-        try:
-            await self.initialize()
-            return {
-                "status": "healthy",
-                "client_type": "azure_openai" if self.is_azure else "openai",
-                "deployment": self.deployment_name if self.is_azure else "gpt-4"
-            }
-        except Exception as e:
+        if not self._initialized:
             return {
                 "status": "unhealthy",
-                "error": str(e)
+                "error": "AI client not initialized"
             }
+        return {
+            "status": "healthy",
+            "client_type": "azure_openai" if self.is_azure else "openai",
+            "deployment": self.deployment_name if self.is_azure else "gpt-4"
+        }
 
 
 # Global AI client instance
@@ -0,0 +1,26 @@
+"""
+Cached low-resolution clock for hot-path timestamps
+"""
+import time
+from datetime import datetime, timezone
+
+# Tick (ms) the cached string was formatted at, and the string itself
+_last_tick: int = -1
+_last_iso: str = ""
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO-8601 string, cached at 1 ms resolution
+
+    Message bursts within the same millisecond share one datetime
+    construction and one isoformat() call; time.time_ns() is a cheap
+    integer read, so repeat calls cost a division and a compare.
+    The string stays naive-UTC, matching what utcnow().isoformat()
+    produced, without the deprecated API.
+    """
+    global _last_tick, _last_iso
+    tick = time.time_ns() // 1_000_000
+    if tick != _last_tick:
+        _last_tick = tick
+        _last_iso = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+    return _last_iso
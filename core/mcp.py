@@ -2,14 +2,15 @@
 Model Context Protocol (MCP) implementation for agent communication
 """
 import asyncio
-import json
 import logging
 import uuid
-from datetime import datetime
 from typing import Any, Dict, Optional
 
+import orjson
 import structlog
 
+from .clock import now_iso
+
 logger = structlog.get_logger(__name__)
 
 
@@ -25,17 +26,31 @@ class MCPMessage:
         conversation_id: Optional[str] = None,
         correlation_id: Optional[str] = None,
         message_id: Optional[str] = None,
+        timestamp: Optional[str] = None,
     ):
         self.protocol_version = "1.0"
-        self.message_id = message_id or str(uuid.uuid4())
-        self.timestamp = datetime.utcnow().isoformat()
+        # uuid4().hex skips the hyphenated-string formatting of str(uuid4())
+        self.message_id = message_id or uuid.uuid4().hex
+        self._timestamp = timestamp
         self.sender = sender
         self.recipient = recipient
         self.message_type = message_type  # request, response, notification
         self.payload = payload
-        self.conversation_id = conversation_id or str(uuid.uuid4())
+        self.conversation_id = conversation_id or uuid.uuid4().hex
         self.correlation_id = correlation_id
 
+    @property
+    def timestamp(self) -> str:
+        """Creation time, materialized on first access
+
+        Most messages live and die inside one in-process round trip where
+        nothing reads the timestamp, so the isoformat() call is deferred
+        until something actually asks for it.
+        """
+        if self._timestamp is None:
+            self._timestamp = now_iso()
+        return self._timestamp
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert message to dictionary"""
         return {
@@ -61,16 +76,29 @@ class MCPMessage:
             conversation_id=data.get("conversation_id"),
             correlation_id=data.get("correlation_id"),
             message_id=data.get("message_id"),
+            timestamp=data.get("timestamp"),
         )
 
     def to_json(self) -> str:
-        """Convert message to JSON string"""
-        return json.dumps(self.to_dict(), indent=2)
+        """Convert message to a compact JSON string for the wire
+
+        Bus peers consume this, not humans — compact output halves the
+        byte volume and skips the encoder's slower pretty path.
+        """
+        return orjson.dumps(self.to_dict()).decode()
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes, skipping the str decode"""
+        return orjson.dumps(self.to_dict())
+
+    def to_json_pretty(self) -> str:
+        """Convert message to indented JSON for debugging and logs"""
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
 
     @classmethod
-    def from_json(cls, json_str: str) -> "MCPMessage":
-        """Create message from JSON string"""
-        return cls.from_dict(json.loads(json_str))
+    def from_json(cls, json_str) -> "MCPMessage":
+        """Create message from a JSON string or bytes"""
+        return cls.from_dict(orjson.loads(json_str))
 
 
 class MCPException(Exception):
@@ -89,15 +117,35 @@ class MCPTimeoutError(MCPException):
 class MessageBus:
     """Central message bus for MCP communication"""
 
+    __slots__ = ("agents", "message_queue", "logger", "_pending", "_flush_task")
+
+    # Batched sends flush once this many messages are pending, or after
+    # the idle window elapses — whichever comes first
+    _BATCH_MAX = 32
+    _BATCH_IDLE_S = 0.005
+
     def __init__(self):
         self.agents: Dict[str, "AgentInterface"] = {}
         self.message_queue: asyncio.Queue = asyncio.Queue()
         self.logger = structlog.get_logger(__name__)
+        self._pending: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def register_agent(self, agent_id: str, agent: "AgentInterface") -> "AgentInterface":
+        """Register an agent with the message bus
+
+        Idempotent: if the id is already taken the existing instance is
+        kept and returned, so re-imports of a wiring module can't stack
+        up duplicate agent singletons.
+        """
+        existing = self.agents.get(agent_id)
+        if existing is not None:
+            self.logger.info("Agent already registered, keeping existing", agent_id=agent_id)
+            return existing
 
-    def register_agent(self, agent_id: str, agent: "AgentInterface"):
-        """Register an agent with the message bus"""
         self.agents[agent_id] = agent
         self.logger.info("Agent registered", agent_id=agent_id)
+        return agent
 
     def unregister_agent(self, agent_id: str):
         """Unregister an agent from the message bus"""
@@ -107,11 +155,11 @@ class MessageBus:
 
     async def send_message(self, message: MCPMessage) -> MCPMessage:
         """Send a message to the appropriate agent"""
-        if message.recipient not in self.agents:
+        # Single hash lookup on the hottest path
+        agent = self.agents.get(message.recipient)
+        if agent is None:
             raise MCPException(f"Agent {message.recipient} not found")
 
-        agent = self.agents[message.recipient]
-
         try:
             self.logger.info(
                 "Sending message",
@@ -132,20 +180,142 @@ class MessageBus:
             return response
 
         except Exception as e:
-            error_message = MCPMessage(
-                message_type="error",
-                sender=message.recipient,
-                recipient=message.sender,
-                payload={"error": str(e), "error_type": type(e).__name__},
-                conversation_id=message.conversation_id,
-                correlation_id=message.message_id,
-            )
             self.logger.error(
                 "Message processing failed",
                 message_id=message.message_id,
                 error=str(e)
             )
-            return error_message
+            return self._error_message(message, e)
+
+    @staticmethod
+    def _error_message(message: MCPMessage, error: Exception) -> MCPMessage:
+        """Build the error response for a failed dispatch"""
+        return MCPMessage(
+            message_type="error",
+            sender=message.recipient,
+            recipient=message.sender,
+            payload={"error": str(error), "error_type": type(error).__name__},
+            conversation_id=message.conversation_id,
+            correlation_id=message.message_id,
+        )
+
+    async def send_batch(self, messages: list) -> list:
+        """Send a batch of messages, fanning out across agents
+
+        Messages are grouped by recipient so each agent is looked up
+        once, then every process_message call runs concurrently.
+        Failures are converted to the same error messages send_message
+        produces; responses come back in input order.
+        """
+        groups: Dict[str, list] = {}
+        for index, message in enumerate(messages):
+            groups.setdefault(message.recipient, []).append(index)
+
+        responses: list = [None] * len(messages)
+
+        async def _dispatch(recipient: str, indices: list):
+            agent = self.agents.get(recipient)
+            if agent is None:
+                error = MCPException(f"Agent {recipient} not found")
+                for index in indices:
+                    responses[index] = self._error_message(messages[index], error)
+                return
+
+            results = await asyncio.gather(
+                *(agent.process_message(messages[index]) for index in indices),
+                return_exceptions=True,
+            )
+            for index, result in zip(indices, results):
+                if isinstance(result, Exception):
+                    self.logger.error(
+                        "Message processing failed",
+                        message_id=messages[index].message_id,
+                        error=str(result)
+                    )
+                    responses[index] = self._error_message(messages[index], result)
+                else:
+                    responses[index] = result
+
+        await asyncio.gather(*(
+            _dispatch(recipient, indices) for recipient, indices in groups.items()
+        ))
+        return responses
+
+    async def health_check_all(self) -> Dict[str, Any]:
+        """Run every registered agent's health check concurrently
+
+        The checks are independent, so their waits overlap under one
+        gather instead of adding up per agent.
+        """
+        agent_ids = list(self.agents.keys())
+        results = await asyncio.gather(
+            *(self.agents[agent_id].health_check() for agent_id in agent_ids),
+            return_exceptions=True,
+        )
+        return {
+            agent_id: (
+                {"agent_id": agent_id, "status": "unhealthy", "error": str(result)}
+                if isinstance(result, Exception) else result
+            )
+            for agent_id, result in zip(agent_ids, results)
+        }
+
+    async def send_message_batched(self, message: MCPMessage) -> MCPMessage:
+        """Send a message through the batching buffer
+
+        Concurrent callers are coalesced into one send_batch dispatch:
+        the buffer flushes once _BATCH_MAX messages are queued or after
+        _BATCH_IDLE_S with no new arrivals. Awaits and returns this
+        message's own response.
+        """
+        if self._pending is None:
+            self._pending = asyncio.Queue()
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.put_nowait((message, future))
+        self._ensure_flush_task()
+
+        return await future
+
+    def _ensure_flush_task(self):
+        """Guarantee a flush task is running while the buffer is non-empty
+
+        The done callback re-checks the buffer when a task finishes, so a
+        message enqueued between the flush loop's final empty() check and
+        task completion is picked up instead of waiting on a dead task.
+        """
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending())
+            self._flush_task.add_done_callback(self._on_flush_done)
+
+    def _on_flush_done(self, task):
+        if not self._pending.empty():
+            self._ensure_flush_task()
+
+    async def _flush_pending(self):
+        """Drain the batching buffer until it goes idle"""
+        while not self._pending.empty():
+            batch = [self._pending.get_nowait()]
+            while len(batch) < self._BATCH_MAX:
+                try:
+                    batch.append(await asyncio.wait_for(
+                        self._pending.get(), timeout=self._BATCH_IDLE_S
+                    ))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                responses = await self.send_batch([message for message, _ in batch])
+            except Exception as e:
+                # Never strand callers: a dispatch failure resolves every
+                # future in the batch instead of killing the flush task
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
 
 
 # Global message bus instance
@@ -155,6 +325,8 @@ message_bus = MessageBus()
 class AgentInterface:
     """Base interface for all agents"""
 
+    __slots__ = ("agent_id", "logger")
+
     def __init__(self, agent_id: str):
         self.agent_id = agent_id
         self.logger = structlog.get_logger(f"agent.{agent_id}")
@@ -168,7 +340,7 @@ class AgentInterface:
         return {
             "agent_id": self.agent_id,
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
         }
 
     def get_capabilities(self) -> list:
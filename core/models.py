@@ -3,6 +3,7 @@ Data models for the Agentic Scheduler
 """
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -18,6 +19,7 @@ class EventType(str, Enum):
     OTHER = "other"
 
 
+
 class CalendarEvent(BaseModel):
     """Calendar event data model"""
     id: Optional[str] = None
@@ -34,28 +36,25 @@ class CalendarEvent(BaseModel):
     recurrence_pattern: Optional[str] = None  # "weekly", "biweekly"
     metadata: Dict[str, str] = Field(default_factory=dict)
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    @cached_property
+    def start_iso(self) -> str:
+        """ISO start time, formatted once and reused across sends"""
+        return self.start_time.isoformat()
+
+    @cached_property
+    def end_iso(self) -> str:
+        """ISO end time, formatted once and reused across sends"""
+        return self.end_time.isoformat()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with proper serialization"""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat(),
-            "location": self.location,
-            "recurrence_rule": self.recurrence_rule,
-            "course_code": self.course_code,
-            "course_name": self.course_name,
-            "event_type": self.event_type.value,
-            "is_recurring": self.is_recurring,
-            "recurrence_pattern": self.recurrence_pattern,
-            "metadata": self.metadata
-        }
+        # pydantic-core does the datetime/enum encoding in Rust, so this
+        # beats a hand-built dict of field-by-field isoformat() calls
+        return self.model_dump(mode="json")
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes via the cached Rust serializer"""
+        return self.__pydantic_serializer__.to_json(self)
 
 
 class FileUpload(BaseModel):
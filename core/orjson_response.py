@@ -0,0 +1,29 @@
+"""
+orjson-backed JSON response class for FastAPI
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """Let orjson serialize pydantic models without a Python pre-pass"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered through orjson's Rust encoder
+
+    Handles datetime/UUID/enum values natively and dumps pydantic models
+    via the default hook, so handlers can return models or plain dicts
+    without stdlib json ever running.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -2,6 +2,7 @@
 """
 Smart installer for Agentic Scheduler that handles Python 3.13 compatibility
 """
+import os
 import subprocess
 import sys
 import platform
@@ -9,10 +10,12 @@ from pathlib import Path
 
 
 def run_command(cmd, description):
-    """Run a command and return success status"""
+    """Run a command (argv list) and return success status"""
     print(f"🔧 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        # No shell=True: skips a shell fork per command and sidesteps
+        # quoting issues on Windows paths
+        result = subprocess.run(cmd, capture_output=True, text=True)
         if result.returncode == 0:
             print(f"✅ {description} completed successfully")
             return True
@@ -61,7 +64,7 @@ def main():
 
     # Create virtual environment if it doesn't exist
     if not Path("venv").exists():
-        if not run_command("python3 -m venv venv", "Creating virtual environment"):
+        if not run_command([sys.executable, "-m", "venv", "venv"], "Creating virtual environment"):
             sys.exit(1)
     else:
         print("✅ Virtual environment already exists")
@@ -80,9 +83,13 @@ def main():
         print(f"❌ Requirements file {req_file} not found")
         sys.exit(1)
 
-    # Install requirements
-    pip_cmd = f"venv/bin/pip" if platform.system() != "Windows" else "venv\\Scripts\\pip"
-    install_cmd = f"{pip_cmd} install -r {req_file}"
+    # Install requirements in a single pip invocation - pip downloads
+    # wheels concurrently, so one run beats per-package installs
+    pip_cmd = "venv/bin/pip" if platform.system() != "Windows" else "venv\\Scripts\\pip"
+    install_cmd = [pip_cmd, "install", "--no-input", "-r", req_file]
+
+    # Repeat runs hit the wheel cache instead of re-downloading
+    os.environ.setdefault("PIP_CACHE_DIR", str(Path.home() / ".cache" / "pip"))
 
     print(f"📦 Installing dependencies from {req_file}...")
     print("This may take a few minutes...")
@@ -98,12 +105,12 @@ def main():
 
         # Try alternative installation methods
         alt_methods = [
-            f"{pip_cmd} install --upgrade pip",
-            f"{pip_cmd} install --user -r {req_file}",
+            [pip_cmd, "install", "--upgrade", "pip"],
+            [pip_cmd, "install", "--user", "-r", req_file],
         ]
 
         for method in alt_methods:
-            print(f"\n🔄 Trying: {method}")
+            print(f"\n🔄 Trying: {' '.join(method)}")
             if run_command(method, "Alternative installation"):
                 print("🎉 Alternative installation succeeded!")
                 break
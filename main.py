@@ -1,13 +1,41 @@
 """
 Agentic Scheduler - Main Application Entry Point
 """
+import os
+from contextlib import asynccontextmanager
+
+import structlog
 import uvicorn
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from api.routes import router as api_router
 from config.settings import settings
+from core.ai_client import ai_client
+from core.mcp import message_bus
+from core.orjson_response import ORJSONResponse
+
+logger = structlog.get_logger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize shared clients before the first request"""
+    # Precompile all templates at startup so first-render parse cost
+    # never lands in a request's p99
+    for name in template_env.loader.list_templates():
+        template_env.get_template(name)
+    try:
+        await ai_client.initialize()
+    except Exception as e:
+        # Development setups may have no AI credentials; AI-backed routes
+        # fall back to their degraded paths instead of blocking startup
+        logger.warning("AI client initialization deferred", error=str(e))
+    yield
+    if ai_client.client is not None:
+        await ai_client.client.close()
 
 # Create FastAPI application
 app = FastAPI(
@@ -15,7 +43,11 @@ app = FastAPI(
     description="A chatbot-based calendar management system",
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson serializes responses (including datetimes) in C, which matters
+    # for event-heavy payloads
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Mount static files
@@ -24,8 +56,17 @@ app.mount("/static", StaticFiles(directory="ui/static"), name="static")
 # Include API routes
 app.include_router(api_router, prefix="/api")
 
-# Setup templates
-templates = Jinja2Templates(directory="ui/templates")
+# Setup templates with a filesystem bytecode cache: template parse cost
+# is paid once per template version and the compiled code objects are
+# reused across worker restarts. No explicit directory: Jinja's default
+# is a per-user 0700 dir with ownership checks, so other local users
+# cannot plant compiled-template bytecode
+template_env = Environment(
+    loader=FileSystemLoader("ui/templates"),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False,
+)
+templates = Jinja2Templates(env=template_env)
 
 
 @app.get("/")
@@ -40,11 +81,25 @@ async def health_check():
     return {"status": "healthy", "version": "0.1.0"}
 
 
+@app.get("/health/agents")
+async def health_check_agents():
+    """Per-agent health, collected concurrently across the bus"""
+    return await message_bus.health_check_all()
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=settings.port,
-        reload=True,
+        # Autoreload only in dev; reload and multi-worker are mutually
+        # exclusive, so production gets one worker per core instead
+        reload=settings.debug,
+        workers=None if settings.debug else (settings.workers or os.cpu_count()),
+        # "auto" resolves to uvloop when it is installed, cutting event-loop
+        # dispatch overhead on these I/O-bound routes
+        loop=settings.event_loop,
+        # httptools parses HTTP in C instead of pure-Python h11
+        http="httptools",
         log_level="info"
     )
@@ -1,9 +1,11 @@
 """
 Pytest configuration and fixtures
 """
+import importlib.util
 import pytest
 import os
 import sys
+import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -18,71 +20,29 @@ os.environ.setdefault('OPENAI_API_KEY', 'test-key')
 os.environ.setdefault('GOOGLE_CALENDAR_API_KEY', 'test-key')
 os.environ.setdefault('GOOGLE_CALENDAR_ID', 'test-calendar-id')
 
-# Mock optional dependencies that might not be available during testing
-try:
-    import structlog
-    STRUCTLOG_AVAILABLE = True
-except ImportError:
-    # Mock structlog if not available
-    structlog_mock = MagicMock()
-    structlog_mock.get_logger.return_value = MagicMock()
-    sys.modules['structlog'] = structlog_mock
-    STRUCTLOG_AVAILABLE = False
-
-try:
-    import pytesseract
-    PYTESSERACT_AVAILABLE = True
-except ImportError:
-    # Mock pytesseract if not available
-    sys.modules['pytesseract'] = MagicMock()
-    PYTESSERACT_AVAILABLE = False
-
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    # Mock PIL if not available
-    pil_mock = MagicMock()
-    sys.modules['PIL'] = pil_mock
-    sys.modules['PIL.Image'] = pil_mock.Image
-    PIL_AVAILABLE = False
-
-try:
-    import PyPDF2
-    PYPDF2_AVAILABLE = True
-except ImportError:
-    # Mock PyPDF2 if not available
-    sys.modules['PyPDF2'] = MagicMock()
-    PYPDF2_AVAILABLE = False
-
-try:
-    import openpyxl
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    # Mock openpyxl if not available
-    sys.modules['openpyxl'] = MagicMock()
-    OPENPYXL_AVAILABLE = False
-
-try:
-    from googleapiclient.discovery import build
-    GOOGLE_API_AVAILABLE = True
-except ImportError:
-    # Mock google API if not available
-    google_mock = MagicMock()
-    sys.modules['googleapiclient'] = google_mock
-    sys.modules['googleapiclient.discovery'] = google_mock.discovery
-    sys.modules['google.oauth2.credentials'] = MagicMock()
-    sys.modules['googleapiclient.errors'] = MagicMock()
-    GOOGLE_API_AVAILABLE = False
-
-try:
-    from openai import AsyncOpenAI, AsyncAzureOpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    # Mock openai if not available
-    openai_mock = MagicMock()
-    sys.modules['openai'] = openai_mock
-    OPENAI_AVAILABLE = False
+# Mock optional dependencies that might not be available during testing.
+# find_spec only checks for installability - nothing heavy is actually
+# imported at conftest load, so collection startup stays cheap; installed
+# modules are imported lazily by whichever tests need them.
+def _stub_if_missing(*names):
+    """Stub a module tree with MagicMock if its top-level package is absent"""
+    if importlib.util.find_spec(names[0].partition('.')[0]) is None:
+        for name in names:
+            sys.modules.setdefault(name, MagicMock())
+
+
+_stub_if_missing('structlog')
+_stub_if_missing('pytesseract')
+_stub_if_missing('PIL', 'PIL.Image')
+_stub_if_missing('PyPDF2')
+_stub_if_missing('openpyxl')
+_stub_if_missing(
+    'googleapiclient',
+    'googleapiclient.discovery',
+    'googleapiclient.errors',
+    'google.oauth2.credentials',
+)
+_stub_if_missing('openai')
 
 
 @pytest.fixture(scope="session")
@@ -95,9 +55,10 @@ def test_app():
         pytest.skip(f"App dependencies not available: {e}")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_client(test_app):
-    """Create test client"""
+    """Create test client once per session - app startup dominates
+    integration-test wall time, so every test shares this instance"""
     try:
         from fastapi.testclient import TestClient
         return TestClient(test_app)
@@ -105,12 +66,25 @@ def test_client(test_app):
         pytest.skip("FastAPI TestClient not available")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_file_content():
-    """Sample file content for testing"""
+    """Sample file content for testing (immutable, shared per session)"""
     return b"Mathematics 101 - Monday 9:00 AM - Room 101\nPhysics Lab - Tuesday 2:00 PM - Lab 205"
 
 
+@pytest.fixture(scope="session")
+def sample_upload_file(sample_file_content):
+    """Spooled sample upload, written once per session
+
+    Handing the open file to TestClient streams the multipart body in
+    chunks instead of materializing it as one bytes blob; callers must
+    seek(0) before each request.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=64 * 1024) as spool:
+        spool.write(sample_file_content)
+        yield spool
+
+
 @pytest.fixture
 def sample_excel_data():
     """Sample Excel-like data for testing"""
@@ -5,56 +5,75 @@ import pytest
 
 
 @pytest.mark.integration
+# Under pytest -n auto --dist=loadgroup all app tests land on one
+# worker and share the session-scoped TestClient
+@pytest.mark.xdist_group("fastapi_app")
 class TestFileUpload:
     """Test file upload endpoints"""
 
-    @pytest.fixture(autouse=True)
-    def setup_method(self, test_client):
-        """Setup test client"""
-        self.client = test_client
-
-    def test_health_endpoint(self):
+    def test_health_endpoint(self, test_client):
         """Test health check endpoint"""
-        response = self.client.get("/health")
+        response = test_client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert "System is healthy" in data["message"]
 
-    def test_agents_endpoint(self):
+    def test_agents_endpoint(self, test_client):
         """Test agents listing endpoint"""
-        response = self.client.get("/api/agents")
+        response = test_client.get("/api/agents")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert "agents" in data["data"]
 
-    def test_chat_endpoint_get(self):
+    def test_chat_endpoint_get(self, test_client):
         """Test chat endpoint GET request"""
-        response = self.client.post("/api/chat", json={"message": "Hello", "message_type": "user"})
+        response = test_client.post("/api/chat", json={"message": "Hello", "message_type": "user"})
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert "message" in data
 
-    def test_upload_empty_file(self):
+    def test_upload_empty_file(self, test_client):
         """Test upload with empty file"""
-        files = {"file": ("empty.txt", b"", "text/plain")}
-        response = self.client.post("/api/upload", files=files)
+        # The extension must be allowed so the request reaches the body
+        # read, where the zero-byte stream is rejected
+        files = {"file": ("empty.pdf", b"", "application/pdf")}
+        response = test_client.post("/api/upload", files=files)
         assert response.status_code == 400
         data = response.json()
-        assert data["success"] is False
-        assert "No file provided" in data["message"]
+        assert "Empty file provided" in data["detail"]
+
+    def test_upload_unsupported_type(self, test_client):
+        """Test upload with a disallowed file extension"""
+        files = {"file": ("notes.txt", b"some schedule text", "text/plain")}
+        response = test_client.post("/api/upload", files=files)
+        assert response.status_code == 415
+        data = response.json()
+        assert "Unsupported file type" in data["detail"]
 
-    def test_upload_text_file(self):
-        """Test upload with sample text file"""
-        sample_content = b"Mathematics 101 - Monday 9:00 AM - Room 101\nPhysics Lab - Tuesday 2:00 PM - Lab 205"
-        files = {"file": ("sample.txt", sample_content, "text/plain")}
+    def test_upload_streamed_file(self, test_client, sample_upload_file):
+        """Test upload streaming a file handle through the spool path
 
-        response = self.client.post("/api/upload", files=files)
+        Requires the real parser stack: with PyPDF2 installed, the
+        plain-text bytes fail PDF extraction, the parsing agent replies
+        with an error message, and the route surfaces it through its
+        generic handler. Under the conftest dependency stubs the parse
+        does not fail, so run this one in a fully provisioned
+        environment.
+        """
+        # An open file handle streams the multipart body in chunks
+        # instead of packing it into one in-memory bytes blob. The .pdf
+        # name passes the extension gate so the body is fully spooled
+        # and handed to the parser.
+        sample_upload_file.seek(0)
+        files = {"file": ("sample.pdf", sample_upload_file, "application/pdf")}
+
+        response = test_client.post("/api/upload", files=files)
         assert response.status_code == 200
         data = response.json()
-        assert data["success"] is True
-        assert "sample.txt" in data["message"]
-        assert "events_found" in data["data"]
-        assert "events_created" in data["data"]
+        assert data["success"] is False
+        assert "Upload processing error" in data["message"]
+        assert "parsing_agent" in data["message"]
+        assert data["errors"]
@@ -1,10 +1,38 @@
 """
 Unit tests for MCP (Model Context Protocol) implementation
 """
+import asyncio
+
 import pytest
-from datetime import datetime
 
-from core.mcp import MCPMessage, MCPException
+from core.mcp import AgentInterface, MCPMessage, MCPException, MessageBus
+
+
+class MockAgent(AgentInterface):
+    """Minimal agent shared by the message-bus tests"""
+
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__("mock_agent")
+
+    async def process_message(self, message):
+        return self.create_response(message, {"data": {"result": "processed"}})
+
+    def get_capabilities(self):
+        return ["mock"]
+
+
+# Function-scoped on purpose: the registration tests mutate bus state,
+# so each test gets a fresh (but cheap) bus and agent
+@pytest.fixture
+def bus():
+    return MessageBus()
+
+
+@pytest.fixture
+def mock_agent():
+    return MockAgent()
 
 
 class TestMCPMessage:
@@ -45,12 +73,19 @@ class TestMCPMessage:
         msg_json = message.to_json()
         assert isinstance(msg_json, str)
 
-        # Test from JSON
+        # The wire fast path yields bytes with no str round trip
+        msg_bytes = message.to_json_bytes()
+        assert isinstance(msg_bytes, bytes)
+
+        # Test from JSON (str and bytes are both accepted)
         message2 = MCPMessage.from_json(msg_json)
         assert message2.message_type == message.message_type
         assert message2.sender == message.sender
         assert message2.payload == message.payload
 
+        message3 = MCPMessage.from_json(msg_bytes)
+        assert message3.payload == message.payload
+
     def test_message_with_conversation(self):
         """Test message with conversation context"""
         conversation_id = "test-conversation-123"
@@ -68,21 +103,20 @@ class TestMCPMessage:
         assert message.conversation_id == conversation_id
         assert message.correlation_id == correlation_id
 
-    def test_message_timestamps(self):
+    def test_message_timestamps(self, monkeypatch):
         """Test message timestamp handling"""
-        before = datetime.utcnow()
+        # Freeze the shared clock: deterministic, no ISO reparse, and no
+        # wall-clock bracketing that has to tolerate cache resolution
+        monkeypatch.setattr("core.mcp.now_iso", lambda: "2025-09-01T10:00:00")
+
         message = MCPMessage(
             message_type="test",
             sender="test",
             recipient="test",
             payload={}
         )
-        after = datetime.utcnow()
-
-        # Parse the timestamp
-        timestamp = datetime.fromisoformat(message.timestamp.replace('Z', '+00:00'))
 
-        assert before <= timestamp <= after
+        assert message.timestamp == "2025-09-01T10:00:00"
 
 
 class TestMCPException:
@@ -105,110 +139,108 @@ class TestMCPException:
 class TestMessageBus:
     """Test message bus functionality"""
 
-    def test_message_bus_creation(self):
+    def test_message_bus_creation(self, bus):
         """Test message bus initialization"""
-        from core.mcp import MessageBus
-
-        bus = MessageBus()
         assert hasattr(bus, 'agents')
         assert hasattr(bus, 'message_queue')
         assert len(bus.agents) == 0
 
-    def test_agent_registration(self):
+    def test_agent_registration(self, bus, mock_agent):
         """Test agent registration"""
-        from core.mcp import MessageBus, AgentInterface
-
-        class MockAgent(AgentInterface):
-            def __init__(self):
-                super().__init__("mock_agent")
-
-            async def process_message(self, message):
-                return self.create_success_response(message, {"result": "mock"})
-
-            def get_capabilities(self):
-                return ["mock"]
-
-        bus = MessageBus()
-        agent = MockAgent()
-
-        bus.register_agent("mock_agent", agent)
+        bus.register_agent("mock_agent", mock_agent)
         assert "mock_agent" in bus.agents
-        assert bus.agents["mock_agent"] == agent
+        assert bus.agents["mock_agent"] == mock_agent
 
-    def test_agent_unregistration(self):
+    def test_agent_unregistration(self, bus, mock_agent):
         """Test agent unregistration"""
-        from core.mcp import MessageBus, AgentInterface
-
-        class MockAgent(AgentInterface):
-            def __init__(self):
-                super().__init__("mock_agent")
-
-            async def process_message(self, message):
-                return self.create_success_response(message, {"result": "mock"})
-
-            def get_capabilities(self):
-                return ["mock"]
-
-        bus = MessageBus()
-        agent = MockAgent()
-
-        bus.register_agent("mock_agent", agent)
+        bus.register_agent("mock_agent", mock_agent)
         assert "mock_agent" in bus.agents
 
         bus.unregister_agent("mock_agent")
         assert "mock_agent" not in bus.agents
 
-    def test_message_routing(self):
+    @pytest.mark.asyncio
+    async def test_message_routing(self, bus, mock_agent):
         """Test message routing to agents"""
-        import asyncio
-        from core.mcp import MessageBus, AgentInterface
+        bus.register_agent("mock_agent", mock_agent)
+
+        message = MCPMessage(
+            message_type="test",
+            sender="test_sender",
+            recipient="mock_agent",
+            payload={"action": "test"}
+        )
+
+        response = await bus.send_message(message)
+        assert response.message_type == "response"
+        assert response.payload["data"]["result"] == "processed"
 
-        class MockAgent(AgentInterface):
-            def __init__(self):
-                super().__init__("mock_agent")
+    @pytest.mark.asyncio
+    async def test_unknown_agent_error(self, bus):
+        """Test error handling for unknown agents"""
+        message = MCPMessage(
+            message_type="test",
+            sender="test_sender",
+            recipient="unknown_agent",
+            payload={"action": "test"}
+        )
 
-            async def process_message(self, message):
-                return self.create_success_response(message, {"result": "processed"})
+        with pytest.raises(MCPException) as exc_info:
+            await bus.send_message(message)
 
-            def get_capabilities(self):
-                return ["mock"]
+        assert "unknown_agent" in str(exc_info.value)
 
-        async def test_routing():
-            bus = MessageBus()
-            agent = MockAgent()
-            bus.register_agent("mock_agent", agent)
+    @pytest.mark.asyncio
+    async def test_send_batch(self, bus, mock_agent):
+        """Test batch dispatch keeps input order across recipients"""
+        bus.register_agent("mock_agent", mock_agent)
 
-            message = MCPMessage(
+        messages = [
+            MCPMessage(
                 message_type="test",
                 sender="test_sender",
-                recipient="mock_agent",
+                recipient=recipient,
                 payload={"action": "test"}
             )
-
-            response = await bus.send_message(message)
-            assert response.message_type == "response"
-            assert response.payload["data"]["result"] == "processed"
-
-        asyncio.run(test_routing())
-
-    def test_unknown_agent_error(self):
-        """Test error handling for unknown agents"""
-        import asyncio
-        from core.mcp import MessageBus
-
-        async def test_unknown_agent():
-            bus = MessageBus()
-
-            message = MCPMessage(
+            for recipient in ("mock_agent", "unknown_agent", "mock_agent")
+        ]
+
+        responses = await bus.send_batch(messages)
+
+        assert len(responses) == 3
+        assert responses[0].payload["data"]["result"] == "processed"
+        assert responses[2].payload["data"]["result"] == "processed"
+        # The unknown recipient becomes an in-order error response
+        # instead of failing the whole batch
+        assert responses[1].message_type == "error"
+        assert "unknown_agent" in responses[1].payload["error"]
+        assert responses[1].correlation_id == messages[1].message_id
+
+    @pytest.mark.asyncio
+    async def test_send_message_batched(self, bus, mock_agent):
+        """Test concurrent batched sends all resolve to their own response"""
+        bus.register_agent("mock_agent", mock_agent)
+
+        messages = [
+            MCPMessage(
                 message_type="test",
-                sender="test_sender",
-                recipient="unknown_agent",
+                sender=f"sender_{i}",
+                recipient="mock_agent",
                 payload={"action": "test"}
             )
+            for i in range(5)
+        ]
 
-            with pytest.raises(MCPException) as exc_info:
-                await bus.send_message(message)
+        responses = await asyncio.gather(
+            *(bus.send_message_batched(message) for message in messages)
+        )
 
-            assert "unknown_agent" in str(exc_info.value)
+        for message, response in zip(messages, responses):
+            assert response.message_type == "response"
+            assert response.recipient == message.sender
+            assert response.payload["data"]["result"] == "processed"
 
-        asyncio.run(test_unknown_agent())
+        # A late arrival after the flush task drains must not strand:
+        # the done-callback respawn picks it up
+        late = await bus.send_message_batched(messages[0])
+        assert late.payload["data"]["result"] == "processed"
@@ -6,6 +6,11 @@ from datetime import datetime
 
 from core.models import CalendarEvent, EventType
 
+# Shared immutable instants for event construction - built once instead
+# of re-entering the datetime constructor in every test
+T10 = datetime(2025, 9, 1, 10, 0)
+T11 = datetime(2025, 9, 1, 11, 0)
+
 
 class TestCalendarEvent:
     """Test CalendarEvent model functionality"""
@@ -14,8 +19,8 @@ class TestCalendarEvent:
         """Test basic CalendarEvent creation"""
         event = CalendarEvent(
             title="Test Event",
-            start_time=datetime(2025, 9, 1, 10, 0),
-            end_time=datetime(2025, 9, 1, 11, 0),
+            start_time=T10,
+            end_time=T11,
             location="Test Room",
             event_type=EventType.CLASS
         )
@@ -31,8 +36,8 @@ class TestCalendarEvent:
             id="test-123",
             title="Test Event",
             description="Test description",
-            start_time=datetime(2025, 9, 1, 10, 0),
-            end_time=datetime(2025, 9, 1, 11, 0),
+            start_time=T10,
+            end_time=T11,
             location="Test Room",
             course_code="CS101",
             course_name="Computer Science 101",
@@ -44,20 +49,23 @@ class TestCalendarEvent:
 
         event_dict = event.to_dict()
 
-        assert event_dict["id"] == "test-123"
-        assert event_dict["title"] == "Test Event"
-        assert event_dict["description"] == "Test description"
-        assert event_dict["location"] == "Test Room"
-        assert event_dict["course_code"] == "CS101"
-        assert event_dict["course_name"] == "Computer Science 101"
-        assert event_dict["event_type"] == "class"
-        assert event_dict["is_recurring"] is True
-        assert event_dict["recurrence_pattern"] == "weekly"
-        assert event_dict["metadata"]["priority"] == "high"
+        # One subset comparison walks the dict once and reports every
+        # mismatched key on failure instead of just the first
+        expected = {
+            "id": "test-123",
+            "title": "Test Event",
+            "description": "Test description",
+            "location": "Test Room",
+            "course_code": "CS101",
+            "course_name": "Computer Science 101",
+            "event_type": "class",
+            "is_recurring": True,
+            "recurrence_pattern": "weekly",
+            "metadata": {"priority": "high"},
+        }
+        assert expected == {key: event_dict[key] for key in expected}
 
         # Check datetime serialization
-        assert "start_time" in event_dict
-        assert "end_time" in event_dict
         assert isinstance(event_dict["start_time"], str)
         assert isinstance(event_dict["end_time"], str)
 
@@ -66,8 +74,8 @@ class TestCalendarEvent:
         # Valid event
         event = CalendarEvent(
             title="Valid Event",
-            start_time=datetime(2025, 9, 1, 10, 0),
-            end_time=datetime(2025, 9, 1, 11, 0)
+            start_time=T10,
+            end_time=T11
         )
         assert event.title == "Valid Event"
 
@@ -75,23 +83,27 @@ class TestCalendarEvent:
         with pytest.raises(ValueError):
             CalendarEvent(
                 # missing title
-                start_time=datetime(2025, 9, 1, 10, 0),
-                end_time=datetime(2025, 9, 1, 11, 0)
+                start_time=T10,
+                end_time=T11
             )
 
-    def test_event_type_enum(self):
+    @pytest.mark.parametrize("member,value", [
+        (EventType.CLASS, "class"),
+        (EventType.LAB, "lab"),
+        (EventType.STUDY, "study"),
+        (EventType.MEETING, "meeting"),
+        (EventType.EXAM, "exam"),
+        (EventType.OTHER, "other"),
+    ])
+    def test_event_type_enum(self, member, value):
         """Test EventType enum values"""
-        assert EventType.CLASS.value == "class"
-        assert EventType.LAB.value == "lab"
-        assert EventType.STUDY.value == "study"
-        assert EventType.MEETING.value == "meeting"
-        assert EventType.EXAM.value == "exam"
-        assert EventType.OTHER.value == "other"
+        assert member.value == value
 
-        # Test default value
+    def test_event_type_default(self):
+        """Test the default event type"""
         event = CalendarEvent(
             title="Test",
-            start_time=datetime(2025, 9, 1, 10, 0),
-            end_time=datetime(2025, 9, 1, 11, 0)
+            start_time=T10,
+            end_time=T11
         )
         assert event.event_type == EventType.OTHER
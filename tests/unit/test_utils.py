@@ -5,43 +5,55 @@ import pytest
 from datetime import datetime
 
 from core.utils import (
+    NUMPY_AVAILABLE,
     validate_file_type,
     validate_file_size,
     parse_datetime_flexible,
     extract_dates_from_text,
     calculate_overlap,
+    calculate_overlaps_matrix,
     is_within_school_year,
     clean_filename
 )
 from config.settings import ALLOWED_FILE_TYPES
 
 
+_MAX_SIZE = 1024 * 1024  # 1MB
+
+# Shared immutable instants for the overlap cases - datetime objects are
+# immutable, so one construction each is safe to reuse everywhere
+T10 = datetime(2025, 9, 1, 10, 0)
+T1030 = datetime(2025, 9, 1, 10, 30)
+T11 = datetime(2025, 9, 1, 11, 0)
+T1130 = datetime(2025, 9, 1, 11, 30)
+T12 = datetime(2025, 9, 1, 12, 0)
+T13 = datetime(2025, 9, 1, 13, 0)
+
+
 class TestFileValidation:
     """Test file validation utilities"""
 
-    def test_validate_file_type(self):
+    @pytest.mark.parametrize("filename,expected", [
+        ("document.pdf", True),
+        ("schedule.xlsx", True),
+        ("image.png", True),
+        ("document.doc", False),
+        ("file", False),
+        ("", False),
+    ])
+    def test_validate_file_type(self, filename, expected):
         """Test file type validation"""
-        # Valid types
-        assert validate_file_type("document.pdf", ALLOWED_FILE_TYPES) is True
-        assert validate_file_type("schedule.xlsx", ALLOWED_FILE_TYPES) is True
-        assert validate_file_type("image.png", ALLOWED_FILE_TYPES) is True
-
-        # Invalid types
-        assert validate_file_type("document.doc", ALLOWED_FILE_TYPES) is False
-        assert validate_file_type("file", ALLOWED_FILE_TYPES) is False
-        assert validate_file_type("", ALLOWED_FILE_TYPES) is False
-
-    def test_validate_file_size(self):
+        assert validate_file_type(filename, ALLOWED_FILE_TYPES) is expected
+
+    @pytest.mark.parametrize("size,expected", [
+        (1024, True),
+        (_MAX_SIZE, True),
+        (_MAX_SIZE + 1, False),
+        (2048 * 1024, False),
+    ])
+    def test_validate_file_size(self, size, expected):
         """Test file size validation"""
-        max_size = 1024 * 1024  # 1MB
-
-        # Valid sizes
-        assert validate_file_size(1024, max_size) is True
-        assert validate_file_size(max_size, max_size) is True
-
-        # Invalid sizes
-        assert validate_file_size(max_size + 1, max_size) is False
-        assert validate_file_size(2048 * 1024, max_size) is False
+        assert validate_file_size(size, _MAX_SIZE) is expected
 
 
 class TestDateTimeUtils:
@@ -62,59 +74,82 @@ class TestDateTimeUtils:
         # Test invalid format
         assert parse_datetime_flexible("invalid") is None
 
-    def test_extract_dates_from_text(self):
+    @pytest.mark.parametrize("text,expected_count", [
+        # One case per branch of the fused module-level date regex
+        ("Meeting on 2025-09-01 at 2 PM", 1),             # YYYY-MM-DD
+        ("Due 09/15/2025", 1),                            # MM/DD/YYYY
+        ("September 15, 2025 review", 1),                 # Month DD, YYYY
+        ("Sep 15, 2025 review", 1),                       # Mon DD, YYYY
+        ("no dates here", 0),
+        ("Meeting on 2025-09-01 at 2 PM and another on September 15, 2025", 2),
+        # Relative phrases match the regex but dateutil cannot resolve
+        # them to a date, so nothing is extracted
+        ("see you tomorrow", 0),
+        ("next monday works", 0),
+    ])
+    def test_extract_dates_from_text(self, text, expected_count):
         """Test date extraction from text"""
-        text = "Meeting on 2025-09-01 at 2 PM and another on September 15, 2025"
-        dates = extract_dates_from_text(text)
-
-        assert len(dates) >= 1  # Should find at least one date
-
-    def test_calculate_overlap(self):
+        assert len(extract_dates_from_text(text)) == expected_count
+
+    @pytest.mark.parametrize("start1,end1,start2,end2,expected", [
+        (T10, T11, T10, T11, 60),      # Complete overlap
+        (T10, T11, T1030, T1130, 30),  # Partial overlap
+        (T10, T11, T12, T13, 0),       # No overlap
+    ])
+    def test_calculate_overlap(self, start1, end1, start2, end2, expected):
         """Test event overlap calculation"""
-        # Complete overlap
-        overlap = calculate_overlap(
-            datetime(2025, 9, 1, 10, 0), datetime(2025, 9, 1, 11, 0),  # Event 1
-            datetime(2025, 9, 1, 10, 0), datetime(2025, 9, 1, 11, 0)   # Event 2
-        )
-        assert overlap == 60  # 60 minutes
-
-        # Partial overlap
-        overlap = calculate_overlap(
-            datetime(2025, 9, 1, 10, 0), datetime(2025, 9, 1, 11, 0),  # Event 1
-            datetime(2025, 9, 1, 10, 30), datetime(2025, 9, 1, 11, 30)  # Event 2
-        )
-        assert overlap == 30  # 30 minutes
-
-        # No overlap
-        overlap = calculate_overlap(
-            datetime(2025, 9, 1, 10, 0), datetime(2025, 9, 1, 11, 0),  # Event 1
-            datetime(2025, 9, 1, 12, 0), datetime(2025, 9, 1, 13, 0)   # Event 2
-        )
-        assert overlap == 0
-
-    def test_is_within_school_year(self):
+        assert calculate_overlap(start1, end1, start2, end2) == expected
+
+    # Mixed-duration batch covering full, partial, zero and asymmetric
+    # overlaps; the matrix below is its expected pairwise minutes
+    _MATRIX_STARTS = [T10, T1030, T10, T12]
+    _MATRIX_ENDS = [T11, T1130, T13, T13]
+    _MATRIX_EXPECTED = [
+        [60, 30, 60, 0],
+        [30, 60, 60, 0],
+        [60, 60, 180, 60],
+        [0, 0, 60, 60],
+    ]
+
+    def test_calculate_overlaps_matrix_fallback(self, monkeypatch):
+        """Test the pure-Python overlap matrix path"""
+        monkeypatch.setattr("core.utils.NUMPY_AVAILABLE", False)
+        matrix = calculate_overlaps_matrix(self._MATRIX_STARTS, self._MATRIX_ENDS)
+        assert matrix == self._MATRIX_EXPECTED
+
+    def test_calculate_overlaps_matrix_empty(self, monkeypatch):
+        """Test the overlap matrix with an empty batch"""
+        monkeypatch.setattr("core.utils.NUMPY_AVAILABLE", False)
+        assert calculate_overlaps_matrix([], []) == []
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_calculate_overlaps_matrix_numpy(self):
+        """Test the vectorized path agrees with the scalar fallback"""
+        matrix = calculate_overlaps_matrix(self._MATRIX_STARTS, self._MATRIX_ENDS)
+        assert matrix.tolist() == self._MATRIX_EXPECTED
+
+    @pytest.mark.parametrize("date,expected", [
+        (datetime(2025, 9, 1), True),
+        (datetime(2025, 12, 15), True),
+        (datetime(2026, 6, 30), True),
+        (datetime(2025, 8, 31), False),
+        (datetime(2026, 7, 1), False),
+    ])
+    def test_is_within_school_year(self, date, expected):
         """Test school year validation"""
-        # Within school year
-        assert is_within_school_year(datetime(2025, 9, 1)) is True
-        assert is_within_school_year(datetime(2025, 12, 15)) is True
-        assert is_within_school_year(datetime(2026, 6, 30)) is True
-
-        # Outside school year
-        assert is_within_school_year(datetime(2025, 8, 31)) is False
-        assert is_within_school_year(datetime(2026, 7, 1)) is False
-
-    def test_clean_filename(self):
+        assert is_within_school_year(date) is expected
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("test.pdf", "test.pdf"),
+        ("my file.pdf", "my_file.pdf"),
+        ("file<>|?.pdf", "file.pdf"),
+    ])
+    def test_clean_filename(self, raw, expected):
         """Test filename cleaning"""
-        # Normal filename
-        assert clean_filename("test.pdf") == "test.pdf"
-
-        # Filename with spaces
-        assert clean_filename("my file.pdf") == "my_file.pdf"
-
-        # Filename with dangerous characters
-        assert clean_filename("file<>|?.pdf") == "file.pdf"
+        assert clean_filename(raw) == expected
 
-        # Long filename
+    def test_clean_filename_length_clamp(self):
+        """Test long filenames are clamped while keeping the extension"""
         long_name = "a" * 100 + ".pdf"
         cleaned = clean_filename(long_name)
         assert len(cleaned) <= 104  # 100 + .pdf + some buffer